@@ -15,6 +15,7 @@ class DependencyExtractor:
     def __init__(self, plan_json: Dict[str, Any]):
         self.plan_json = plan_json
         self.address_to_resource_id: Dict[str, str] = {}
+        self.base_address_to_resource_id: Dict[str, str] = {}
         self.dependency_map: Dict[str, List[str]] = {}
         self.missing_dependencies: Set[str] = set()
     
@@ -32,6 +33,7 @@ class DependencyExtractor:
             Dict mapping resource IDs to lists of dependency resource IDs
         """
         self.address_to_resource_id = address_to_id_map
+        self.base_address_to_resource_id = self._build_base_address_index(address_to_id_map)
         
         # Extract from resource_changes section
         resource_changes = self.plan_json.get('resource_changes', [])
@@ -60,6 +62,31 @@ class DependencyExtractor:
         
         return self.dependency_map
     
+    @staticmethod
+    def _build_base_address_index(address_to_id_map: Dict[str, str]) -> Dict[str, str]:
+        """
+        Index resource IDs by every address prefix that precedes a '['.
+        
+        Lets base-address references (e.g. "aws_instance.web" for
+        "aws_instance.web[0]") resolve with one dict lookup. The first
+        instance in map order wins, as with a linear prefix scan.
+        
+        Args:
+            address_to_id_map: Mapping of Terraform addresses to NRG resource IDs
+            
+        Returns:
+            Dict mapping base addresses to the first matching resource ID
+        """
+        index: Dict[str, str] = {}
+        
+        for addr, res_id in address_to_id_map.items():
+            bracket = addr.find('[')
+            while bracket != -1:
+                index.setdefault(addr[:bracket], res_id)
+                bracket = addr.find('[', bracket + 1)
+        
+        return index
+    
     def _process_resource_change(self, resource_change: Dict[str, Any]) -> None:
         """Process a single resource change to extract dependencies."""
         address = resource_change.get('address')
@@ -128,21 +155,14 @@ class DependencyExtractor:
             NRG resource ID or None if not found
         """
         # Try exact match first
-        if terraform_address in self.address_to_resource_id:
-            return self.address_to_resource_id[terraform_address]
+        resource_id = self.address_to_resource_id.get(terraform_address)
+        if resource_id is not None:
+            return resource_id
         
         # For dependencies on resources with count/for_each,
-        # Terraform may reference the base address
-        # We need to find all instances and return the first one
-        # (or handle this differently based on requirements)
-        
-        # Try to find any resource that starts with this address
-        for addr, res_id in self.address_to_resource_id.items():
-            if addr.startswith(terraform_address + '['):
-                # Found an instance of this resource
-                return res_id
-        
-        return None
+        # Terraform may reference the base address; resolve to the
+        # first instance of that resource
+        return self.base_address_to_resource_id.get(terraform_address)
 
 
 def build_dependency_graph(
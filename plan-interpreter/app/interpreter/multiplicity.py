@@ -1,6 +1,7 @@
 """
 Resource multiplicity resolution (count and for_each).
 """
+import sys
 from typing import List, Dict, Any, Optional
 from app.utils.logger import get_logger
 
@@ -72,6 +73,9 @@ def extract_module_path(address: str) -> List[str]:
         
     Returns:
         Module path list (e.g., ["module.vpc", "module.subnets"])
+        
+    Module names are interned so every node in a module shares the same
+    string objects.
     """
     parts = address.split('.')
     module_path = []
@@ -79,7 +83,7 @@ def extract_module_path(address: str) -> List[str]:
     i = 0
     while i < len(parts):
         if parts[i] == 'module' and i + 1 < len(parts):
-            module_path.append(f"module.{parts[i + 1]}")
+            module_path.append(sys.intern(f"module.{parts[i + 1]}"))
             i += 2
         else:
             i += 1
@@ -2,8 +2,10 @@
 NRG (Normalized Resource Graph) builder.
 Main orchestrator for plan interpretation.
 """
+import sys
 from typing import Dict, Any, List
 from datetime import datetime
+from collections import Counter
 from app.schemas.nrg import (
     NormalizedResourceGraph,
     NRGNode,
@@ -66,6 +68,9 @@ class NRGBuilder:
         # Update nodes with dependencies
         self._apply_dependencies()
         
+        # Count resources by type in a single pass
+        self.resources_by_type = dict(Counter(node.resource_type for node in self.nodes))
+        
         # Build metadata
         total_dependencies = sum(len(deps) for deps in self.dependency_graph.values())
         
@@ -131,16 +136,12 @@ class NRGBuilder:
             
             # Build address-to-ID mapping for dependency resolution
             self.address_to_id[node.terraform_address] = node.resource_id
-            
-            # Update statistics
-            resource_type = node.resource_type
-            self.resources_by_type[resource_type] = \
-                self.resources_by_type.get(resource_type, 0) + 1
     
     def _build_node(self, instance: Dict[str, Any]) -> NRGNode:
         """Build a single NRG node from resource instance."""
         full_address = instance['full_address']
-        resource_type = instance['type']
+        # Low-cardinality strings are interned so nodes share one object
+        resource_type = sys.intern(instance['type'])
         values = instance.get('values', {})
         
         # Generate deterministic resource ID
@@ -168,6 +169,8 @@ class NRGBuilder:
         
         # Extract region (explicit only, no heuristics)
         region = attributes.get('region')
+        if isinstance(region, str):
+            region = sys.intern(region)
         
         # Dependencies will be populated later
         dependencies = []
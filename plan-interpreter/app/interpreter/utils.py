@@ -3,6 +3,8 @@ Deterministic resource ID generation and utilities.
 """
 import hashlib
 import json
+import sys
+from functools import lru_cache
 from typing import Any, Dict
 
 
@@ -34,10 +36,14 @@ def compute_plan_hash(plan_json: Dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode()).hexdigest()[:16]
 
 
+@lru_cache(maxsize=1024)
 def extract_provider_from_type(resource_type: str) -> str:
     """
     Extract provider from resource type.
     
+    Memoized: plans repeat a small set of resource types across many
+    count/for_each instances.
+    
     Args:
         resource_type: e.g., "aws_instance", "azurerm_virtual_machine"
         
@@ -46,7 +52,7 @@ def extract_provider_from_type(resource_type: str) -> str:
     """
     # Resource types are typically provider_resourcetype
     parts = resource_type.split('_', 1)
-    return parts[0] if len(parts) > 1 else "unknown"
+    return sys.intern(parts[0]) if len(parts) > 1 else "unknown"
 
 
 def is_value_unknown(value: Any) -> bool:
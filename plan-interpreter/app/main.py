@@ -3,6 +3,7 @@ Main FastAPI application for Terraform Plan Interpreter.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from app.routers import internal
 from app.config import settings
 from app.utils.logger import setup_logging, get_logger
@@ -15,11 +16,31 @@ setup_logging(
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan events."""
+    # Startup
+    logger.info(
+        "Terraform Plan Interpreter starting",
+        extra={
+            'environment': settings.environment,
+            'log_level': settings.log_level
+        }
+    )
+    
+    yield
+    
+    # Shutdown
+    logger.info("Terraform Plan Interpreter shutting down")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Terraform Plan Interpreter",
     description="Parse Terraform plan JSON and produce Normalized Resource Graph",
     version="1.0.0",
+    lifespan=lifespan,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None
 )
@@ -37,24 +58,6 @@ app.add_middleware(
 app.include_router(internal.router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup."""
-    logger.info(
-        "Terraform Plan Interpreter starting",
-        extra={
-            'environment': settings.environment,
-            'log_level': settings.log_level
-        }
-    )
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown."""
-    logger.info("Terraform Plan Interpreter shutting down")
-
-
 @app.get("/")
 async def root():
     """Root endpoint."""
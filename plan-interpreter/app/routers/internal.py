@@ -1,7 +1,8 @@
 """
 Internal API endpoints for plan interpretation.
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from starlette.concurrency import run_in_threadpool
 from app.schemas.api import InterpretRequest, InterpretResponse
 from app.interpreter.nrg_builder import interpret_plan
 from app.utils.plan_loader import PlanLoader
@@ -19,11 +20,12 @@ router = APIRouter(prefix="/internal", tags=["internal"])
     summary="Interpret Terraform plan JSON",
     description="Parse terraform show -json output and produce Normalized Resource Graph"
 )
-async def interpret_terraform_plan(request: InterpretRequest) -> InterpretResponse:
+async def interpret_terraform_plan(request: InterpretRequest) -> Response:
     """
     Interpret Terraform plan and produce NRG.
     
-    This is a pure CPU-bound operation with no side effects.
+    This is a pure CPU-bound operation with no side effects, so loading
+    and interpretation run in the threadpool to keep the event loop free.
     """
     logger.info(
         "Received interpretation request",
@@ -32,12 +34,12 @@ async def interpret_terraform_plan(request: InterpretRequest) -> InterpretRespon
     
     try:
         # Load plan JSON from reference
-        plan_json = PlanLoader.load(request.plan_json_reference)
+        plan_json = await run_in_threadpool(PlanLoader.load, request.plan_json_reference)
         
         logger.info(f"Loaded plan JSON ({len(str(plan_json))} bytes)")
         
         # Build NRG from plan JSON
-        nrg = interpret_plan(plan_json)
+        nrg = await run_in_threadpool(interpret_plan, plan_json)
         
         logger.info(
             "Interpretation complete",
@@ -48,9 +50,15 @@ async def interpret_terraform_plan(request: InterpretRequest) -> InterpretRespon
             }
         )
         
-        return InterpretResponse(
-            normalized_resource_graph=[node.model_dump() for node in nrg.nodes],
-            interpretation_metadata=nrg.metadata.model_dump()
+        # Serialize once in pydantic-core instead of dumping to dicts and
+        # re-validating them against response_model
+        response = InterpretResponse.model_construct(
+            normalized_resource_graph=nrg.nodes,
+            interpretation_metadata=nrg.metadata
+        )
+        return Response(
+            content=response.model_dump_json(),
+            media_type="application/json"
         )
     
     except (FileNotFoundError, ValueError) as e:
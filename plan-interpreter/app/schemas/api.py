@@ -1,8 +1,9 @@
 """
 Request/Response models for Plan Interpreter API.
 """
+from typing import List
 from pydantic import BaseModel, Field
-from app.schemas.nrg import NormalizedResourceGraph
+from app.schemas.nrg import NRGNode, InterpretationMetadata
 
 
 class InterpretRequest(BaseModel):
@@ -21,8 +22,8 @@ class InterpretRequest(BaseModel):
 class InterpretResponse(BaseModel):
     """Response from plan interpretation."""
     
-    normalized_resource_graph: list  # List of NRGNode
-    interpretation_metadata: dict  # InterpretationMetadata
+    normalized_resource_graph: List[NRGNode]
+    interpretation_metadata: InterpretationMetadata
     
     class Config:
         json_schema_extra = {
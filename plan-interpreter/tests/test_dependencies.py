@@ -241,3 +241,27 @@ class TestDependencyExtraction:
         
         assert 'res_001' in dep_graph
         assert dep_graph['res_001'] == ['res_002']
+    
+    def test_base_address_resolves_to_first_instance(self):
+        """Test base-address references resolve to the first indexed instance."""
+        plan_json = {
+            'resource_changes': [
+                {
+                    'address': 'aws_eip.web',
+                    'change': {
+                        'after_depends_on': ['aws_instance.web', 'module.app']
+                    }
+                }
+            ]
+        }
+        
+        address_to_id = {
+            'aws_eip.web': 'res_001',
+            'aws_instance.web[0]': 'res_002',
+            'aws_instance.web[1]': 'res_003',
+            'module.app[0].aws_instance.api': 'res_004'
+        }
+        
+        dep_graph = build_dependency_graph(plan_json, address_to_id)
+        
+        assert dep_graph['res_001'] == ['res_002', 'res_004']
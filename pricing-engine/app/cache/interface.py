@@ -62,6 +62,63 @@ class CacheInterface(ABC):
         pass
 
 
+class SyncCacheInterface(ABC):
+    """
+    Synchronous cache interface for in-process backends.
+    
+    Backends that perform no I/O implement this alongside CacheInterface so
+    hot call sites can skip coroutine creation and event-loop scheduling.
+    """
+    
+    @abstractmethod
+    def get_sync(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache without awaiting.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    def set_sync(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Set value in cache with TTL without awaiting.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        pass
+    
+    @abstractmethod
+    def delete_sync(self, key: str) -> None:
+        """
+        Delete key from cache without awaiting.
+        
+        Args:
+            key: Cache key
+        """
+        pass
+    
+    @abstractmethod
+    def exists_sync(self, key: str) -> bool:
+        """
+        Check if key exists in cache without awaiting.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if key exists
+        """
+        pass
+
+
 def generate_cache_key(
     account_id: str,
     region: str,
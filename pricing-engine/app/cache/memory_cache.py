@@ -1,17 +1,23 @@
 """
 In-memory cache fallback implementation.
 """
+import heapq
 import time
-from typing import Any, Optional, Dict, Tuple
+from typing import Any, Optional, Dict, List, Tuple
 from collections import OrderedDict
-from app.cache.interface import CacheInterface
+from app.cache.interface import CacheInterface, SyncCacheInterface
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class MemoryCache(CacheInterface):
-    """In-memory cache with LRU eviction."""
+class MemoryCache(CacheInterface, SyncCacheInterface):
+    """
+    In-memory cache with LRU eviction.
+    
+    All work is done in the *_sync methods; the async methods are thin
+    wrappers kept for CacheInterface compatibility.
+    """
     
     def __init__(self, max_size: int = 1000):
         """
@@ -22,10 +28,28 @@ class MemoryCache(CacheInterface):
         """
         self.max_size = max_size
         self._cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        # Min-heap of (expiry, key); stale entries are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._hit_count = 0
         self._miss_count = 0
     
     async def get(self, key: str) -> Optional[Any]:
+        """Get value from memory cache."""
+        return self.get_sync(key)
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Set value in memory cache with TTL."""
+        self.set_sync(key, value, ttl)
+    
+    async def delete(self, key: str) -> None:
+        """Delete key from memory cache."""
+        self.delete_sync(key)
+    
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in memory cache."""
+        return self.exists_sync(key)
+    
+    def get_sync(self, key: str) -> Optional[Any]:
         """Get value from memory cache."""
         if key not in self._cache:
             self._miss_count += 1
@@ -47,7 +71,7 @@ class MemoryCache(CacheInterface):
         logger.debug(f"Cache hit: {key}")
         return value
     
-    async def set(self, key: str, value: Any, ttl: int) -> None:
+    def set_sync(self, key: str, value: Any, ttl: int) -> None:
         """Set value in memory cache with TTL."""
         expiry = time.time() + ttl
         
@@ -57,9 +81,15 @@ class MemoryCache(CacheInterface):
         
         self._cache[key] = (value, expiry)
         self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        
+        # Rebuild the heap if stale entries outnumber live ones
+        if len(self._expiry_heap) > 2 * self.max_size:
+            self._rebuild_expiry_heap()
+        
         logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
     
-    async def delete(self, key: str) -> None:
+    def delete_sync(self, key: str) -> None:
         """Delete key from memory cache."""
         if key in self._cache:
             del self._cache[key]
@@ -68,9 +98,10 @@ class MemoryCache(CacheInterface):
     async def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry_heap.clear()
         logger.info("Cache cleared")
     
-    async def exists(self, key: str) -> bool:
+    def exists_sync(self, key: str) -> bool:
         """Check if key exists in memory cache."""
         if key not in self._cache:
             return False
@@ -95,23 +126,35 @@ class MemoryCache(CacheInterface):
         self._hit_count = 0
         self._miss_count = 0
     
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live cache entries."""
+        self._expiry_heap = [(expiry, key) for key, (_, expiry) in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
+    
     def evict_expired(self) -> int:
         """
         Evict all expired entries.
         
+        Pops the expiry heap only while its head has expired, so the cost
+        is proportional to the number of expired entries rather than the
+        cache size. Heap entries for keys that were since overwritten,
+        deleted or LRU-evicted are discarded when popped.
+        
         Returns:
             Number of entries evicted
         """
         now = time.time()
-        expired_keys = [
-            key for key, (_, expiry) in self._cache.items()
-            if now > expiry
-        ]
+        heap = self._expiry_heap
+        evicted = 0
         
-        for key in expired_keys:
-            del self._cache[key]
+        while heap and now > heap[0][0]:
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == expiry:
+                del self._cache[key]
+                evicted += 1
         
-        if expired_keys:
-            logger.debug(f"Evicted {len(expired_keys)} expired entries")
+        if evicted:
+            logger.debug(f"Evicted {evicted} expired entries")
         
-        return len(expired_keys)
+        return evicted
@@ -1,7 +1,7 @@
 """
 Redis-backed cache implementation.
 """
-import json
+import orjson
 import redis.asyncio as redis
 from typing import Any, Optional
 from app.cache.interface import CacheInterface
@@ -56,7 +56,7 @@ class RedisCache(CacheInterface):
             if value:
                 self._hit_count += 1
                 logger.debug(f"Cache hit: {key}")
-                return json.loads(value)
+                return orjson.loads(value)
             else:
                 self._miss_count += 1
                 logger.debug(f"Cache miss: {key}")
@@ -73,7 +73,8 @@ class RedisCache(CacheInterface):
             return
         
         try:
-            serialized = json.dumps(value)
+            # orjson encodes datetimes and str enums from model_dump() natively
+            serialized = orjson.dumps(value)
             await self.client.setex(key, ttl, serialized)
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
         except Exception as e:
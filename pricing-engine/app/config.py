@@ -3,7 +3,8 @@ Configuration management for Pricing Engine.
 """
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import List
+from functools import cached_property
+from typing import Tuple, FrozenSet
 
 
 class Settings(BaseSettings):
@@ -16,6 +17,11 @@ class Settings(BaseSettings):
     pricing_api_base_url: str = "https://pricing.us-east-1.amazonaws.com"
     pricing_cache_ttl: int = 86400  # 24 hours
     max_price_api_retries: int = 3
+    # Warmup downloads and normalizes whole offer files (AmazonEC2 is several
+    # GB), so it is opt-in and limited to the listed services/regions
+    pricing_warmup_enabled: bool = False
+    pricing_warmup_services: str = "ec2,ebs,elb,rds"
+    pricing_warmup_regions: str = "us-east-1"
     
     # Supported Services (ONLY implemented normalizers)
     supported_services: str = "ec2,ebs,elb,rds"
@@ -35,9 +41,25 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
     
-    def get_supported_services_list(self) -> List[str]:
-        """Get list of supported services."""
-        return [s.strip() for s in self.supported_services.split(',')]
+    @cached_property
+    def supported_services_list(self) -> Tuple[str, ...]:
+        """Supported services, parsed once from the comma-separated setting."""
+        return tuple(s.strip() for s in self.supported_services.split(','))
+    
+    @cached_property
+    def supported_services_set(self) -> FrozenSet[str]:
+        """Supported services as a set, for per-request membership checks."""
+        return frozenset(self.supported_services_list)
+    
+    @cached_property
+    def pricing_warmup_services_list(self) -> Tuple[str, ...]:
+        """Services to warm at startup, parsed once from the comma-separated setting."""
+        return tuple(s.strip() for s in self.pricing_warmup_services.split(',') if s.strip())
+    
+    @cached_property
+    def pricing_warmup_regions_list(self) -> Tuple[str, ...]:
+        """Regions to warm at startup, parsed once from the comma-separated setting."""
+        return tuple(r.strip() for r in self.pricing_warmup_regions.split(',') if r.strip())
 
 
 # Global settings instance
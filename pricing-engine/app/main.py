@@ -1,8 +1,10 @@
 """
 Pricing Engine - Main FastAPI application.
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.config import settings
 from app.routers import internal
@@ -48,12 +50,16 @@ async def lifespan(app: FastAPI):
     
     # Initialize pricing service
     from app.pricing.pricing_service import PricingService
-    from app.routers import internal
     
     pricing_service = PricingService(pricing_client, cache)
     internal.pricing_service = pricing_service
     logger.info("Initialized Pricing Service")
     
+    # Warm pricing caches in the background so startup is not blocked on downloads
+    warmup_task = None
+    if settings.pricing_warmup_enabled:
+        warmup_task = asyncio.create_task(pricing_service.warmup())
+    
     logger.info("Pricing Engine started successfully")
     
     yield
@@ -61,6 +67,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Pricing Engine...")
     
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    
     if pricing_client:
         await pricing_client.close()
     
@@ -76,6 +85,7 @@ app = FastAPI(
     description="AWS Pricing Data Service",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None
 )
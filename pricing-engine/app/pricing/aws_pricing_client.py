@@ -1,14 +1,61 @@
 """
 AWS Pricing API client.
 """
+import asyncio
+import sys
+import time
 import httpx
-from typing import Dict, Any, Optional
+import ijson
+from ijson.common import ObjectBuilder
+from typing import Dict, Any, Optional, AsyncIterator, Tuple
 from datetime import datetime
 from app.utils.logger import get_logger
 from app.config import settings
 
 logger = get_logger(__name__)
 
+# Map service names to AWS pricing service codes
+SERVICE_CODE_MAP: Dict[str, str] = {
+    'ec2': 'AmazonEC2',
+    'ebs': 'AmazonEC2',  # EBS is part of EC2 pricing
+    'elb': 'AmazonEC2',  # ELB is part of EC2 pricing
+    'rds': 'AmazonRDS',
+    'nat': 'AmazonEC2',  # NAT Gateway is part of EC2
+    'cloudwatch': 'AmazonCloudWatch',
+    'eks': 'AmazonEKS'
+}
+
+# Top-level offer keys kept from the price file; everything else (notably
+# terms.Reserved) is skipped while streaming
+OFFER_METADATA_KEYS = frozenset({'formatVersion', 'disclaimer', 'offerCode', 'version', 'publicationDate'})
+
+# Low-cardinality product attributes repeated across hundreds of thousands of
+# SKUs; interning shares one string per value and speeds the normalizer filters
+INTERNED_ATTRIBUTES = ('location', 'usagetype', 'volumeApiName', 'tenancy', 'operatingSystem', 'instanceFamily')
+
+
+class _ThreadedByteReader:
+    """
+    Adapts an async byte iterator to the blocking file-like read() ijson
+    expects, for parsing in a worker thread while the event loop downloads.
+    """
+    
+    def __init__(self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop):
+        self._chunks = chunks
+        self._loop = loop
+    
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs text
+        if size == 0:
+            return b''
+        return asyncio.run_coroutine_threadsafe(self._next_chunk(), self._loop).result()
+    
+    async def _next_chunk(self) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b''
+
 
 class AWSPricingClient:
     """Client for AWS Price List API."""
@@ -21,12 +68,28 @@ class AWSPricingClient:
             base_url: Base URL for AWS Pricing API
         """
         self.base_url = base_url or settings.pricing_api_base_url
-        self.client = httpx.AsyncClient(timeout=60.0)
+        # One pooled client for the process; offers are a handful of large
+        # downloads, so keep-alive matters more than HTTP/2 multiplexing
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0, read=120.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+        
+        # Parsed offers keyed by service code (ec2/ebs/elb share AmazonEC2),
+        # held in-process: they are far too large to round-trip through Redis
+        self.offer_ttl = settings.pricing_cache_ttl
+        self._offers: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._offer_locks: Dict[str, asyncio.Lock] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
     
     async def fetch_service_pricing(self, service: str) -> Dict[str, Any]:
         """
         Fetch pricing data for a service from AWS Price List API.
         
+        Offers are cached per service code for offer_ttl seconds. Once an
+        entry goes stale it is still served while a background refresh runs,
+        and concurrent misses for the same offer share a single download.
+        
         Args:
             service: AWS service name (ec2, ebs, elb, etc.)
             
@@ -36,27 +99,68 @@ class AWSPricingClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        # Map service names to AWS pricing service codes
-        service_map = {
-            'ec2': 'AmazonEC2',
-            'ebs': 'AmazonEC2',  # EBS is part of EC2 pricing
-            'elb': 'AmazonEC2',  # ELB is part of EC2 pricing  
-            'rds': 'AmazonRDS',
-            'nat': 'AmazonEC2',  # NAT Gateway is part of EC2
-            'cloudwatch': 'AmazonCloudWatch',
-            'eks': 'AmazonEKS'
-        }
-        
-        service_code = service_map.get(service, service)
+        service_code = SERVICE_CODE_MAP.get(service, service)
+        
+        cached = self._offers.get(service_code)
+        if cached is None:
+            lock = self._offer_locks.setdefault(service_code, asyncio.Lock())
+            async with lock:
+                cached = self._offers.get(service_code)
+                if cached is None:
+                    return await self._download_offer(service, service_code)
+        
+        fetched_at, data = cached
+        if time.monotonic() - fetched_at >= self.offer_ttl and service_code not in self._refresh_tasks:
+            logger.info(f"Pricing for {service_code} is stale, refreshing in background")
+            self._refresh_tasks[service_code] = asyncio.create_task(self._refresh_offer(service, service_code))
+        
+        return data
+    
+    def get_cached_offer_version(self, service: str) -> Optional[str]:
+        """
+        Get the version of the offer currently held for a service, without fetching.
+        
+        Args:
+            service: AWS service name
+            
+        Returns:
+            Offer version, or None if the offer has not been loaded yet
+        """
+        cached = self._offers.get(SERVICE_CODE_MAP.get(service, service))
+        if cached is None:
+            return None
+        return cached[1].get('version')
+    
+    async def _refresh_offer(self, service: str, service_code: str):
+        """Re-download a stale offer, keeping the old copy on failure."""
+        try:
+            await self._download_offer(service, service_code)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {service_code}: {e}")
+        finally:
+            self._refresh_tasks.pop(service_code, None)
+    
+    async def _download_offer(self, service: str, service_code: str) -> Dict[str, Any]:
+        """
+        Download, parse and cache the offer file for a service code.
+        
+        Args:
+            service: AWS service name, for logging
+            service_code: AWS pricing service code
+            
+        Returns:
+            Dict containing pricing data
+        """
         url = f"{self.base_url}/offers/v1.0/aws/{service_code}/current/index.json"
         
         logger.info(f"Fetching pricing for service: {service} from {url}")
         
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+            async with self.client.stream("GET", url) as response:
+                response.raise_for_status()
+                data = await self._parse_offer(response.aiter_bytes())
             
-            data = response.json()
+            self._offers[service_code] = (time.monotonic(), data)
             logger.info(f"Successfully fetched pricing for {service}")
             
             return data
@@ -65,6 +169,84 @@ class AWSPricingClient:
             logger.error(f"Failed to fetch pricing for {service}: {e}")
             raise
     
+    async def _parse_offer(self, chunks: AsyncIterator[bytes]) -> Dict[str, Any]:
+        """
+        Incrementally parse an offer file, keeping only what normalizers read.
+        
+        Parsing runs in a worker thread; the event loop only hands it body
+        chunks, so health checks and lookups are served during the download.
+        
+        Args:
+            chunks: Async iterator over the response body
+            
+        Returns:
+            Dict with offer metadata, products, products_by_location and terms.OnDemand
+        """
+        reader = _ThreadedByteReader(chunks, asyncio.get_running_loop())
+        return await asyncio.to_thread(self._parse_offer_stream, reader)
+    
+    def _parse_offer_stream(self, reader: _ThreadedByteReader) -> Dict[str, Any]:
+        """
+        Parse an offer from a blocking reader (runs off the event loop).
+        
+        Products and on-demand terms are rebuilt one entry at a time, so the
+        raw body and the reserved-term tree are never held in memory.
+        
+        Args:
+            reader: Blocking reader over the response body
+            
+        Returns:
+            Dict with offer metadata, products, products_by_location and terms.OnDemand
+        """
+        products: Dict[str, Any] = {}
+        on_demand: Dict[str, Any] = {}
+        data: Dict[str, Any] = {'products': products, 'terms': {'OnDemand': on_demand}}
+        targets = {'products': products, 'terms.OnDemand': on_demand}
+        
+        section = None
+        key = None
+        builder = None
+        
+        for prefix, event, value in ijson.parse(reader, use_float=True):
+            if prefix in targets:
+                if event == 'map_key':
+                    if builder is not None:
+                        self._store_entry(targets, section, key, builder.value)
+                    section, key, builder = prefix, value, ObjectBuilder()
+                elif event == 'end_map' and builder is not None:
+                    self._store_entry(targets, section, key, builder.value)
+                    section, key, builder = None, None, None
+            elif builder is not None and prefix.startswith(section) and prefix[len(section)] == '.':
+                builder.event(event, value)
+            elif prefix in OFFER_METADATA_KEYS and event in ('string', 'number'):
+                data[prefix] = value
+        
+        # Group products by location so normalizers only visit their region
+        products_by_location: Dict[str, Dict[str, Any]] = {}
+        for sku, product in products.items():
+            location = product.get('attributes', {}).get('location', '')
+            products_by_location.setdefault(location, {})[sku] = product
+        data['products_by_location'] = products_by_location
+        
+        return data
+    
+    @staticmethod
+    def _store_entry(targets: Dict[str, Dict[str, Any]], section: str, key: str, value: Any):
+        """Store a streamed entry, interning repeated product strings."""
+        if section == 'products':
+            product_family = value.get('productFamily')
+            if product_family:
+                value['productFamily'] = sys.intern(product_family)
+            
+            attributes = value.get('attributes')
+            if attributes:
+                for name in INTERNED_ATTRIBUTES:
+                    attr_value = attributes.get(name)
+                    if attr_value:
+                        attributes[name] = sys.intern(attr_value)
+        
+        targets[section][key] = value
+    
     async def get_pricing_metadata(self, service: str) -> Dict[str, Any]:
         """
         Get pricing metadata (version, publication date) for a service.
@@ -94,4 +276,6 @@ class AWSPricingClient:
     
     async def close(self):
         """Close HTTP client."""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
         await self.client.aclose()
@@ -2,7 +2,8 @@
 Base normalizer interface.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import List, Dict, Any, Tuple
 from app.schemas.pricing import NormalizedPrice
 from app.utils.logger import get_logger
 
@@ -44,53 +45,90 @@ class BasePricingNormalizer(ABC):
         attributes = product.get('attributes', {})
         return attributes
     
-    def _extract_pricing_dimensions(self, terms: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _get_region_products(self, pricing_data: Dict[str, Any], pricing_region: str) -> Dict[str, Any]:
         """
-        Extract pricing dimensions from terms.
+        Get the products offered in a pricing region.
+        
+        Uses the client's products_by_location grouping when present and
+        falls back to filtering the full product map.
         
         Args:
-            terms: Terms data from AWS pricing
+            pricing_data: Raw pricing data from AWS Price List API
+            pricing_region: Pricing region name (e.g., 'US East (N. Virginia)')
             
         Returns:
-            List of pricing dimensions
+            Dict mapping SKU to product for that region
         """
-        dimensions = []
+        products_by_location = pricing_data.get('products_by_location')
+        if products_by_location is not None:
+            return products_by_location.get(pricing_region, {})
         
-        # AWS pricing structure: terms -> OnDemand -> {offer_term_code} -> priceDimensions
-        on_demand = terms.get('OnDemand', {})
+        return {
+            sku: product
+            for sku, product in pricing_data.get('products', {}).items()
+            if product.get('attributes', {}).get('location') == pricing_region
+        }
+    
+    def _share_attributes(self, attribute_cache: Dict[Tuple, Dict[str, Any]], attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return one shared dict for each distinct attribute combination.
         
-        for offer_term in on_demand.values():
-            price_dimensions = offer_term.get('priceDimensions', {})
+        Many SKUs differ only in fields that are not kept (license model,
+        capacity status, ...), so their normalized attributes are identical.
+        The shared dicts are read-only by convention.
+        
+        Args:
+            attribute_cache: Per-normalize cache of attribute dicts
+            attributes: Attributes built for the current SKU
             
-            for dimension in price_dimensions.values():
-                dimensions.append(dimension)
+        Returns:
+            Canonical dict with the same contents
+        """
+        return attribute_cache.setdefault(tuple(attributes.values()), attributes)
+    
+    def _build_sku_term_index(self, terms: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bucket on-demand offer terms by SKU in a single pass.
         
-        return dimensions
+        AWS nests terms as OnDemand -> {sku} -> {sku}.{offer_term_code}; a flat
+        OnDemand -> {sku}.{offer_term_code} layout is accepted as well.
+        
+        Args:
+            terms: Terms data from AWS pricing
+            
+        Returns:
+            Dict mapping SKU to its offer terms
+        """
+        sku_index = defaultdict(list)
+        
+        for key, value in terms.get('OnDemand', {}).items():
+            if 'priceDimensions' in value:
+                sku_index[key.split('.', 1)[0]].append(value)
+            else:
+                sku_index[key].extend(value.values())
+        
+        return sku_index
     
-    def _extract_sku_pricing_dimensions(self, terms: Dict[str, Any], sku: str) -> List[Dict[str, Any]]:
+    def _extract_sku_pricing_dimensions(self, sku_index: Dict[str, List[Dict[str, Any]]], sku: str) -> List[Tuple[str, float]]:
         """
         Extract pricing dimensions for a SPECIFIC SKU only.
         
         Args:
-            terms: Terms data from AWS pricing
+            sku_index: SKU to offer terms index from _build_sku_term_index
             sku: SKU to extract dimensions for
             
         Returns:
-            List of pricing dimensions for this SKU only
+            List of (unit, USD price per unit) for this SKU only
         """
         dimensions = []
         
-        # AWS pricing structure: terms -> OnDemand -> {sku}.{offer_term_code} -> priceDimensions
-        on_demand = terms.get('OnDemand', {})
-        
-        for offer_term_code, offer_term in on_demand.items():
-            # Check if this offer term belongs to the current SKU
-            if not offer_term_code.startswith(sku):
-                continue
-            
+        for offer_term in sku_index.get(sku, ()):
             price_dimensions = offer_term.get('priceDimensions', {})
             
             for dimension in price_dimensions.values():
-                dimensions.append(dimension)
+                dimensions.append((
+                    dimension.get('unit', ''),
+                    float(dimension.get('pricePerUnit', {}).get('USD', 0))
+                ))
         
         return dimensions
@@ -1,6 +1,7 @@
 """
 EBS pricing normalizer.
 """
+import re
 from typing import List, Dict, Any
 from datetime import datetime
 from app.pricing.normalizers.base import BasePricingNormalizer
@@ -10,6 +11,8 @@ from app.utils.region_mapper import RegionMapper
 
 logger = get_logger(__name__)
 
+SNAPSHOT_PATTERN = re.compile('snapshot', re.IGNORECASE)
+
 
 class EBSPricingNormalizer(BasePricingNormalizer):
     """Normalizes EBS pricing data."""
@@ -36,14 +39,15 @@ class EBSPricingNormalizer(BasePricingNormalizer):
             logger.warning(f"Unsupported region: {region}")
             return []
         
-        products = pricing_data.get('products', {})
-        terms = pricing_data.get('terms', {})
+        products = self._get_region_products(pricing_data, pricing_region)
+        sku_index = self._build_sku_term_index(pricing_data.get('terms', {}))
+        
+        # One timestamp shared by every price in this normalization
+        effective_date = datetime.utcnow()
+        attribute_cache: Dict[tuple, Dict[str, Any]] = {}
         
         for sku, product in products.items():
-            # Only process products for the specified region
             product_attrs = product.get('attributes', {})
-            if product_attrs.get('location') != pricing_region:
-                continue
             
             # Only process EBS storage
             product_family = product.get('productFamily', '')
@@ -55,23 +59,30 @@ class EBSPricingNormalizer(BasePricingNormalizer):
             if not volume_type:
                 continue
             
-            # Get pricing dimensions
-            dimensions = self._extract_pricing_dimensions(terms)
+            # Determine resource type and pricing unit
+            if SNAPSHOT_PATTERN.search(product_attrs.get('usagetype', '')):
+                resource_type = 'snapshot'
+                pricing_unit = PricingUnit.GB_MONTH
+            else:
+                resource_type = 'volume'
+                pricing_unit = PricingUnit.GB_MONTH
             
-            for dimension in dimensions:
-                unit = dimension.get('unit', '')
-                
-                # Determine resource type and pricing unit
-                if 'snapshot' in product_attrs.get('usagetype', '').lower():
-                    resource_type = 'snapshot'
-                    pricing_unit = PricingUnit.GB_MONTH
-                else:
-                    resource_type = 'volume'
-                    pricing_unit = PricingUnit.GB_MONTH
-                
-                price_per_unit = float(dimension.get('pricePerUnit', {}).get('USD', 0))
-                
-                normalized_price = NormalizedPrice(
+            # Get pricing dimensions FOR THIS SKU ONLY
+            sku_dimensions = self._extract_sku_pricing_dimensions(sku_index, sku)
+            
+            # Same attributes for every dimension of this SKU, shared across
+            # SKUs with identical values
+            attributes = self._share_attributes(attribute_cache, {
+                'volumeType': volume_type,
+                'volumeApiName': product_attrs.get('volumeApiName'),
+                'storageMedia': product_attrs.get('storageMedia'),
+                'maxIopsvolume': product_attrs.get('maxIopsvolume'),
+                'maxThroughputvolume': product_attrs.get('maxThroughputvolume')
+            })
+            
+            for unit, price_per_unit in sku_dimensions:
+                # Fields are already typed here, so skip per-row validation
+                normalized_price = NormalizedPrice.model_construct(
                     service='ebs',
                     resource_type=resource_type,
                     usage_type=product_attrs.get('usagetype', ''),
@@ -79,14 +90,8 @@ class EBSPricingNormalizer(BasePricingNormalizer):
                     unit=pricing_unit,
                     price_per_unit=price_per_unit,
                     currency='USD',
-                    attributes={
-                        'volumeType': volume_type,
-                        'volumeApiName': product_attrs.get('volumeApiName'),
-                        'storageMedia': product_attrs.get('storageMedia'),
-                        'maxIopsvolume': product_attrs.get('maxIopsvolume'),
-                        'maxThroughputvolume': product_attrs.get('maxThroughputvolume')
-                    },
-                    effective_date=datetime.utcnow(),
+                    attributes=attributes,
+                    effective_date=effective_date,
                     sku=sku
                 )
                 
@@ -36,14 +36,15 @@ class EC2PricingNormalizer(BasePricingNormalizer):
             logger.warning(f"Unsupported region: {region}")
             return []
         
-        products = pricing_data.get('products', {})
-        terms = pricing_data.get('terms', {})
+        products = self._get_region_products(pricing_data, pricing_region)
+        sku_index = self._build_sku_term_index(pricing_data.get('terms', {}))
+        
+        # One timestamp shared by every price in this normalization
+        effective_date = datetime.utcnow()
+        attribute_cache: Dict[tuple, Dict[str, Any]] = {}
         
         for sku, product in products.items():
-            # Only process products for the specified region
             product_attrs = product.get('attributes', {})
-            if product_attrs.get('location') != pricing_region:
-                continue
             
             # Only process instance types (not EBS, data transfer, etc.)
             product_family = product.get('productFamily', '')
@@ -56,17 +57,29 @@ class EC2PricingNormalizer(BasePricingNormalizer):
                 continue
             
             # Get pricing dimensions FOR THIS SKU ONLY
-            sku_dimensions = self._extract_sku_pricing_dimensions(terms, sku)
+            sku_dimensions = self._extract_sku_pricing_dimensions(sku_index, sku)
             
-            for dimension in sku_dimensions:
+            # Same attributes for every dimension of this SKU, shared across
+            # SKUs with identical values
+            attributes = self._share_attributes(attribute_cache, {
+                'instanceType': instance_type,
+                'tenancy': product_attrs.get('tenancy', 'Shared'),
+                'operatingSystem': product_attrs.get('operatingSystem', 'Linux'),
+                'vcpu': product_attrs.get('vcpu'),
+                'memory': product_attrs.get('memory'),
+                'storage': product_attrs.get('storage'),
+                'networkPerformance': product_attrs.get('networkPerformance'),
+                'instanceFamily': product_attrs.get('instanceFamily'),
+                'currentGeneration': product_attrs.get('currentGeneration')
+            })
+            
+            for unit, price_per_unit in sku_dimensions:
                 # Only process hourly pricing
-                unit = dimension.get('unit', '')
                 if unit != 'Hrs':
                     continue
                 
-                price_per_unit = float(dimension.get('pricePerUnit', {}).get('USD', 0))
-                
-                normalized_price = NormalizedPrice(
+                # Fields are already typed here, so skip per-row validation
+                normalized_price = NormalizedPrice.model_construct(
                     service='ec2',
                     resource_type='instance',
                     usage_type=product_attrs.get('usagetype', ''),
@@ -74,18 +87,8 @@ class EC2PricingNormalizer(BasePricingNormalizer):
                     unit=PricingUnit.HOUR,
                     price_per_unit=price_per_unit,
                     currency='USD',
-                    attributes={
-                        'instanceType': instance_type,
-                        'tenancy': product_attrs.get('tenancy', 'Shared'),
-                        'operatingSystem': product_attrs.get('operatingSystem', 'Linux'),
-                        'vcpu': product_attrs.get('vcpu'),
-                        'memory': product_attrs.get('memory'),
-                        'storage': product_attrs.get('storage'),
-                        'networkPerformance': product_attrs.get('networkPerformance'),
-                        'instanceFamily': product_attrs.get('instanceFamily'),
-                        'currentGeneration': product_attrs.get('currentGeneration')
-                    },
-                    effective_date=datetime.utcnow(),
+                    attributes=attributes,
+                    effective_date=effective_date,
                     sku=sku
                 )
                 
@@ -1,6 +1,7 @@
 """
 ELB pricing normalizer.
 """
+import re
 from typing import List, Dict, Any
 from datetime import datetime
 from app.pricing.normalizers.base import BasePricingNormalizer
@@ -10,6 +11,11 @@ from app.utils.region_mapper import RegionMapper
 
 logger = get_logger(__name__)
 
+LCU_PATTERN = re.compile('LCU')
+LOAD_BALANCER_USAGE_PATTERN = re.compile('LoadBalancerUsage')
+NETWORK_PATTERN = re.compile('network', re.IGNORECASE)
+APPLICATION_PATTERN = re.compile('application', re.IGNORECASE)
+
 
 class ELBPricingNormalizer(BasePricingNormalizer):
     """Normalizes ELB (ALB/NLB) pricing data."""
@@ -36,14 +42,15 @@ class ELBPricingNormalizer(BasePricingNormalizer):
             logger.warning(f"Unsupported region: {region}")
             return []
         
-        products = pricing_data.get('products', {})
-        terms = pricing_data.get('terms', {})
+        products = self._get_region_products(pricing_data, pricing_region)
+        sku_index = self._build_sku_term_index(pricing_data.get('terms', {}))
+        
+        # One timestamp shared by every price in this normalization
+        effective_date = datetime.utcnow()
+        attribute_cache: Dict[tuple, Dict[str, Any]] = {}
         
         for sku, product in products.items():
-            # Only process products for the specified region
             product_attrs = product.get('attributes', {})
-            if product_attrs.get('location') != pricing_region:
-                continue
             
             # Only process Load Balancer products
             product_family = product.get('productFamily', '')
@@ -52,31 +59,37 @@ class ELBPricingNormalizer(BasePricingNormalizer):
             
             usage_type = product_attrs.get('usagetype', '')
             
-            # Get pricing dimensions
-            dimensions = self._extract_pricing_dimensions(terms)
+            # Determine resource type and pricing unit
+            if LCU_PATTERN.search(usage_type):
+                resource_type = 'lcu'
+                pricing_unit = PricingUnit.LCU_HOUR
+            elif LOAD_BALANCER_USAGE_PATTERN.search(usage_type):
+                resource_type = 'load_balancer'
+                pricing_unit = PricingUnit.HOUR
+            else:
+                continue
             
-            for dimension in dimensions:
-                unit = dimension.get('unit', '')
-                price_per_unit = float(dimension.get('pricePerUnit', {}).get('USD', 0))
-                
-                # Determine resource type and pricing unit
-                if 'LCUUsage' in usage_type or 'LCU' in usage_type:
-                    resource_type = 'lcu'
-                    pricing_unit = PricingUnit.LCU_HOUR
-                elif 'LoadBalancerUsage' in usage_type:
-                    resource_type = 'load_balancer'
-                    pricing_unit = PricingUnit.HOUR
-                else:
-                    continue
-                
-                # Determine load balancer type
-                lb_type = 'alb'  # default
-                if 'network' in usage_type.lower():
-                    lb_type = 'nlb'
-                elif 'application' in usage_type.lower():
-                    lb_type = 'alb'
-                
-                normalized_price = NormalizedPrice(
+            # Determine load balancer type
+            lb_type = 'alb'  # default
+            if NETWORK_PATTERN.search(usage_type):
+                lb_type = 'nlb'
+            elif APPLICATION_PATTERN.search(usage_type):
+                lb_type = 'alb'
+            
+            # Get pricing dimensions FOR THIS SKU ONLY
+            sku_dimensions = self._extract_sku_pricing_dimensions(sku_index, sku)
+            
+            # Same attributes for every dimension of this SKU, shared across
+            # SKUs with identical values
+            attributes = self._share_attributes(attribute_cache, {
+                'loadBalancerType': lb_type,
+                'group': product_attrs.get('group'),
+                'groupDescription': product_attrs.get('groupDescription')
+            })
+            
+            for unit, price_per_unit in sku_dimensions:
+                # Fields are already typed here, so skip per-row validation
+                normalized_price = NormalizedPrice.model_construct(
                     service='elb',
                     resource_type=resource_type,
                     usage_type=usage_type,
@@ -84,12 +97,8 @@ class ELBPricingNormalizer(BasePricingNormalizer):
                     unit=pricing_unit,
                     price_per_unit=price_per_unit,
                     currency='USD',
-                    attributes={
-                        'loadBalancerType': lb_type,
-                        'group': product_attrs.get('group'),
-                        'groupDescription': product_attrs.get('groupDescription')
-                    },
-                    effective_date=datetime.utcnow(),
+                    attributes=attributes,
+                    effective_date=effective_date,
                     sku=sku
                 )
                 
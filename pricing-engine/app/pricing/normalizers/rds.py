@@ -1,7 +1,7 @@
 """
 RDS pricing normalizer.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 from app.pricing.normalizers.base import BasePricingNormalizer
 from app.schemas.pricing import NormalizedPrice, PricingUnit
@@ -14,6 +14,13 @@ logger = get_logger(__name__)
 class RDSPricingNormalizer(BasePricingNormalizer):
     """Normalizes RDS pricing data."""
     
+    # Product family to (resource type, pricing unit)
+    FAMILY_MAP: Dict[str, Tuple[str, PricingUnit]] = {
+        'Database Instance': ('instance', PricingUnit.HOUR),
+        'Database Storage': ('storage', PricingUnit.GB_MONTH),
+        'System Operation': ('backup', PricingUnit.GB_MONTH)
+    }
+    
     def get_service_name(self) -> str:
         return "rds"
     
@@ -36,38 +43,40 @@ class RDSPricingNormalizer(BasePricingNormalizer):
             logger.warning(f"Unsupported region: {region}")
             return []
         
-        products = pricing_data.get('products', {})
-        terms = pricing_data.get('terms', {})
+        products = self._get_region_products(pricing_data, pricing_region)
+        sku_index = self._build_sku_term_index(pricing_data.get('terms', {}))
+        
+        # One timestamp shared by every price in this normalization
+        effective_date = datetime.utcnow()
+        attribute_cache: Dict[tuple, Dict[str, Any]] = {}
         
         for sku, product in products.items():
-            # Only process products for the specified region
             product_attrs = product.get('attributes', {})
-            if product_attrs.get('location') != pricing_region:
+            
+            # Determine resource type and pricing unit
+            mapped = self.FAMILY_MAP.get(product.get('productFamily', ''))
+            if mapped is None:
                 continue
+            resource_type, pricing_unit = mapped
             
-            product_family = product.get('productFamily', '')
+            # Get pricing dimensions FOR THIS SKU ONLY
+            sku_dimensions = self._extract_sku_pricing_dimensions(sku_index, sku)
             
-            # Get pricing dimensions
-            dimensions = self._extract_pricing_dimensions(terms)
+            # Same attributes for every dimension of this SKU, shared across
+            # SKUs with identical values
+            attributes = self._share_attributes(attribute_cache, {
+                'instanceType': product_attrs.get('instanceType'),
+                'instanceClass': product_attrs.get('instanceClass'),
+                'databaseEngine': product_attrs.get('databaseEngine'),
+                'deploymentOption': product_attrs.get('deploymentOption'),
+                'storageType': product_attrs.get('storageType'),
+                'volumeType': product_attrs.get('volumeType'),
+                'engineCode': product_attrs.get('engineCode')
+            })
             
-            for dimension in dimensions:
-                unit = dimension.get('unit', '')
-                price_per_unit = float(dimension.get('pricePerUnit', {}).get('USD', 0))
-                
-                # Determine resource type and pricing unit
-                if product_family == 'Database Instance':
-                    resource_type = 'instance'
-                    pricing_unit = PricingUnit.HOUR
-                elif product_family == 'Database Storage':
-                    resource_type = 'storage'
-                    pricing_unit = PricingUnit.GB_MONTH
-                elif product_family == 'System Operation':
-                    resource_type = 'backup'
-                    pricing_unit = PricingUnit.GB_MONTH
-                else:
-                    continue
-                
-                normalized_price = NormalizedPrice(
+            for unit, price_per_unit in sku_dimensions:
+                # Fields are already typed here, so skip per-row validation
+                normalized_price = NormalizedPrice.model_construct(
                     service='rds',
                     resource_type=resource_type,
                     usage_type=product_attrs.get('usagetype', ''),
@@ -75,16 +84,8 @@ class RDSPricingNormalizer(BasePricingNormalizer):
                     unit=pricing_unit,
                     price_per_unit=price_per_unit,
                     currency='USD',
-                    attributes={
-                        'instanceType': product_attrs.get('instanceType'),
-                        'instanceClass': product_attrs.get('instanceClass'),
-                        'databaseEngine': product_attrs.get('databaseEngine'),
-                        'deploymentOption': product_attrs.get('deploymentOption'),
-                        'storageType': product_attrs.get('storageType'),
-                        'volumeType': product_attrs.get('volumeType'),
-                        'engineCode': product_attrs.get('engineCode')
-                    },
-                    effective_date=datetime.utcnow(),
+                    attributes=attributes,
+                    effective_date=effective_date,
                     sku=sku
                 )
                 
@@ -0,0 +1,76 @@
+"""
+Indexed catalog of normalized prices.
+"""
+from typing import List, Dict, Any, FrozenSet, Tuple
+from app.schemas.pricing import NormalizedPrice
+
+
+def attribute_signature(attributes: Dict[str, Any]) -> FrozenSet[Tuple[str, str]]:
+    """
+    Normalize price attributes into a set of comparable (key, value) pairs.
+    
+    Args:
+        attributes: Attributes of a normalized price
+        
+    Returns:
+        Frozenset of (key, lowercased/stripped string value); None values are skipped
+    """
+    return frozenset(
+        (key, str(value).lower().strip())
+        for key, value in attributes.items()
+        if value is not None
+    )
+
+
+class PriceCatalog:
+    """Normalized prices for one service/region, indexed for SKU matching."""
+    
+    def __init__(self, prices: List[NormalizedPrice]):
+        """
+        Build the catalog in a single pass over the prices.
+        
+        Args:
+            prices: Normalized prices from a service normalizer
+        """
+        self.prices = prices
+        self._by_resource_type: Dict[str, List[NormalizedPrice]] = {}
+        self._signatures_by_resource_type: Dict[str, List[FrozenSet[Tuple[str, str]]]] = {}
+        
+        # Normalizers share attribute dicts between SKUs, so sign each dict once
+        signatures_by_dict: Dict[int, FrozenSet[Tuple[str, str]]] = {}
+        
+        for price in prices:
+            signature = signatures_by_dict.get(id(price.attributes))
+            if signature is None:
+                signature = attribute_signature(price.attributes)
+                signatures_by_dict[id(price.attributes)] = signature
+            
+            self._by_resource_type.setdefault(price.resource_type, []).append(price)
+            self._signatures_by_resource_type.setdefault(price.resource_type, []).append(signature)
+    
+    def __len__(self) -> int:
+        return len(self.prices)
+    
+    def by_resource_type(self, resource_type: str) -> List[NormalizedPrice]:
+        """
+        Get the prices for a resource type.
+        
+        Args:
+            resource_type: Resource type (instance, volume, load_balancer, ...)
+        
+        Returns:
+            Prices of that resource type (shared list, do not mutate)
+        """
+        return self._by_resource_type.get(resource_type, [])
+    
+    def signatures(self, resource_type: str) -> List[FrozenSet[Tuple[str, str]]]:
+        """
+        Get attribute signatures aligned with by_resource_type(resource_type).
+        
+        Args:
+            resource_type: Resource type
+            
+        Returns:
+            One attribute_signature per price, in the same order
+        """
+        return self._signatures_by_resource_type.get(resource_type, [])
@@ -1,7 +1,10 @@
 """
 Pricing service orchestrator.
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from app.schemas.pricing import (
     NormalizedPrice,
@@ -11,15 +14,23 @@ from app.schemas.pricing import (
     ConfidenceLevel
 )
 from app.pricing.aws_pricing_client import AWSPricingClient
+from app.pricing.price_catalog import PriceCatalog
 from app.pricing.sku_matcher import SKUMatcher
-from app.cache.interface import CacheInterface
+from app.cache.interface import CacheInterface, SyncCacheInterface
+from app.config import settings
 from app.utils.logger import get_logger
 from app.utils.region_mapper import RegionMapper
 import hashlib
-import json
+import orjson
 
 logger = get_logger(__name__)
 
+# Recent lookup responses (including empty matches) kept in-process so repeat
+# lookups skip the shared-cache round-trip and response re-validation; entries
+# are dropped once a newer offer version has been loaded
+RECENT_LOOKUP_CACHE_SIZE = 10000
+RECENT_LOOKUP_TTL = 300  # 5 minutes
+
 
 class PricingService:
     """Orchestrates pricing lookups."""
@@ -34,7 +45,16 @@ class PricingService:
         """
         self.pricing_client = pricing_client
         self.cache = cache
+        # In-process caches are read/written without an await round-trip
+        self._sync_cache = cache if isinstance(cache, SyncCacheInterface) else None
         self.normalizers = self._initialize_normalizers()
+        # Price catalogs per (service, region), tagged with the offer
+        # version they were built from so a refreshed offer invalidates them
+        self._normalized: Dict[Tuple[str, str], Tuple[Tuple[Any, Any], PriceCatalog]] = {}
+        self._normalize_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._recent_lookups: "OrderedDict[str, Tuple[float, Optional[str], PriceLookupResponse]]" = OrderedDict()
+        self._recent_hit_count = 0
+        self._recent_miss_count = 0
     
     def _initialize_normalizers(self) -> Dict[str, Any]:
         """Initialize service normalizers."""
@@ -78,11 +98,24 @@ class PricingService:
         # Generate cache key
         cache_key = self._generate_cache_key(request)
         
-        # Check cache
-        cached_response = await self.cache.get(cache_key)
+        # Check recent lookups, then the shared cache
+        recent = self._get_recent_lookup(cache_key, request.service)
+        if recent is not None:
+            logger.info(f"Recent lookup hit for {cache_key}")
+            return recent
+        
+        if self._sync_cache is not None:
+            cached_response = self._sync_cache.get_sync(cache_key)
+        else:
+            cached_response = await self.cache.get(cache_key)
+        # Responses built from an older offer version are treated as misses
         if cached_response:
-            logger.info(f"Cache hit for {cache_key}")
-            return PriceLookupResponse(**cached_response)
+            cached_version = (cached_response.get('metadata') or {}).get('version')
+            if self._is_current_version(request.service, cached_version):
+                logger.info(f"Cache hit for {cache_key}")
+                response = PriceLookupResponse(**cached_response)
+                self._remember_lookup(cache_key, response)
+                return response
         
         logger.info(f"Cache miss for {cache_key}")
         
@@ -108,11 +141,11 @@ class PricingService:
             )
         
         # Normalize pricing
-        normalized_prices = normalizer.normalize(pricing_data, request.region)
+        catalog = await self._get_price_catalog(normalizer, request.region, pricing_data)
         
         # Match SKUs
         matched_prices, confidence = SKUMatcher.match_prices(
-            normalized_prices,
+            catalog,
             request.resource_type,
             request.attributes
         )
@@ -135,12 +168,136 @@ class PricingService:
         )
         
         # Cache response
-        await self.cache.set(cache_key, response.model_dump(), ttl=86400)
+        if self._sync_cache is not None:
+            self._sync_cache.set_sync(cache_key, response.model_dump(), ttl=settings.pricing_cache_ttl)
+        else:
+            await self.cache.set(cache_key, response.model_dump(), ttl=settings.pricing_cache_ttl)
+        self._remember_lookup(cache_key, response)
         
         logger.info(f"Returning {len(matched_prices)} prices with confidence {confidence}")
         
         return response
     
+    def _get_recent_lookup(self, cache_key: str, service: str) -> Optional[PriceLookupResponse]:
+        """
+        Get a recent lookup response (LRU order is refreshed on hit).
+        
+        Entries past their TTL, or built from an offer version other than
+        the one now loaded for the service, are dropped.
+        """
+        entry = self._recent_lookups.get(cache_key)
+        if entry is None:
+            self._recent_miss_count += 1
+            return None
+        
+        expires_at, version, response = entry
+        if time.monotonic() >= expires_at or not self._is_current_version(service, version):
+            del self._recent_lookups[cache_key]
+            self._recent_miss_count += 1
+            return None
+        
+        self._recent_lookups.move_to_end(cache_key)
+        self._recent_hit_count += 1
+        return response
+    
+    def _is_current_version(self, service: str, version: Optional[str]) -> bool:
+        """Check a response's offer version against the offer now loaded (unknown counts as current)."""
+        current_version = self.pricing_client.get_cached_offer_version(service)
+        return current_version is None or current_version == version
+    
+    def _remember_lookup(self, cache_key: str, response: PriceLookupResponse):
+        """Remember a lookup response, evicting the least recently used beyond the bound."""
+        version = response.metadata.version if response.metadata else None
+        self._recent_lookups[cache_key] = (time.monotonic() + RECENT_LOOKUP_TTL, version, response)
+        self._recent_lookups.move_to_end(cache_key)
+        
+        while len(self._recent_lookups) > RECENT_LOOKUP_CACHE_SIZE:
+            self._recent_lookups.popitem(last=False)
+    
+    def get_recent_lookup_stats(self) -> Dict[str, int]:
+        """Get recent-lookup cache size and hit/miss counters."""
+        return {
+            'size': len(self._recent_lookups),
+            'hits': self._recent_hit_count,
+            'misses': self._recent_miss_count
+        }
+    
+    async def warmup(self):
+        """
+        Prefetch offers and normalize them for the configured warmup regions.
+        
+        Services sharing an offer file wait on a single download; a failure
+        only leaves that service to load lazily on its first lookup.
+        """
+        services = [
+            s for s in settings.pricing_warmup_services_list
+            if s in settings.supported_services_set and s in self.normalizers
+        ]
+        regions = [r for r in settings.pricing_warmup_regions_list if RegionMapper.is_supported_region(r)]
+        logger.info(f"Warming pricing caches for services: {services}, regions: {regions}")
+        
+        results = await asyncio.gather(
+            *(self._warm_service(service, regions) for service in services),
+            return_exceptions=True
+        )
+        
+        for service, result in zip(services, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Pricing warmup failed for {service}: {result}")
+        
+        logger.info("Pricing warmup complete")
+    
+    async def _warm_service(self, service: str, regions: List[str]):
+        """Fetch one service's offer and normalize it for the given regions."""
+        normalizer = self.normalizers[service]
+        pricing_data = await self.pricing_client.fetch_service_pricing(service)
+        
+        for region in regions:
+            await self._get_price_catalog(normalizer, region, pricing_data)
+    
+    async def _get_price_catalog(
+        self,
+        normalizer: Any,
+        region: str,
+        pricing_data: Dict[str, Any]
+    ) -> PriceCatalog:
+        """
+        Get the price catalog for a service/region, normalizing at most once per offer version.
+        
+        Normalization is CPU-bound over the whole offer, so it runs in a worker
+        thread; concurrent lookups for the same key wait for a single run.
+        
+        Args:
+            normalizer: Service normalizer
+            region: AWS region code
+            pricing_data: Raw pricing data from AWS
+            
+        Returns:
+            Indexed catalog of normalized prices
+        """
+        key = (normalizer.get_service_name(), region)
+        version = (pricing_data.get('version'), pricing_data.get('publicationDate'))
+        
+        cached = self._normalized.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        lock = self._normalize_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._normalized.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            
+            catalog = await asyncio.to_thread(self._build_catalog, normalizer, region, pricing_data)
+            self._normalized[key] = (version, catalog)
+        
+        return catalog
+    
+    @staticmethod
+    def _build_catalog(normalizer: Any, region: str, pricing_data: Dict[str, Any]) -> PriceCatalog:
+        """Normalize an offer for a region and index the result."""
+        return PriceCatalog(normalizer.normalize(pricing_data, region))
+    
     def _generate_cache_key(self, request: PriceLookupRequest) -> str:
         """
         Generate deterministic cache key.
@@ -152,7 +309,7 @@ class PricingService:
             Cache key
         """
         # Sort attributes for deterministic key
-        attrs_str = json.dumps(request.attributes, sort_keys=True)
-        attrs_hash = hashlib.sha256(attrs_str.encode()).hexdigest()[:16]
+        attrs_bytes = orjson.dumps(request.attributes, option=orjson.OPT_SORT_KEYS)
+        attrs_hash = hashlib.blake2b(attrs_bytes, digest_size=8).hexdigest()
         
         return f"pricing:{request.service}:{request.region}:{request.resource_type}:{attrs_hash}"
@@ -1,8 +1,9 @@
 """
 SKU matching engine for pricing lookups.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union, FrozenSet
 from app.schemas.pricing import NormalizedPrice, ConfidenceLevel
+from app.pricing.price_catalog import PriceCatalog, attribute_signature
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,7 +14,7 @@ class SKUMatcher:
     
     @staticmethod
     def match_prices(
-        normalized_prices: List[NormalizedPrice],
+        normalized_prices: Union[PriceCatalog, List[NormalizedPrice]],
         resource_type: str,
         attributes: Dict[str, Any],
         usage_type: Optional[str] = None
@@ -22,7 +23,7 @@ class SKUMatcher:
         Match normalized prices to resource attributes.
         
         Args:
-            normalized_prices: List of normalized prices from AWS
+            normalized_prices: Price catalog (or plain list) of normalized prices from AWS
             resource_type: Resource type to match
             attributes: Resource attributes for matching
             usage_type: Optional usage type for stricter matching
@@ -35,10 +36,13 @@ class SKUMatcher:
             return [], ConfidenceLevel.LOW
         
         # Filter by resource type
-        type_matches = [
-            p for p in normalized_prices
-            if p.resource_type == resource_type
-        ]
+        if isinstance(normalized_prices, PriceCatalog):
+            type_matches = normalized_prices.by_resource_type(resource_type)
+        else:
+            type_matches = [
+                p for p in normalized_prices
+                if p.resource_type == resource_type
+            ]
         
         if not type_matches:
             logger.warning(f"No prices found for resource_type: {resource_type}")
@@ -49,12 +53,21 @@ class SKUMatcher:
             logger.info(f"No attributes provided, returning {len(type_matches)} type matches")
             return type_matches, ConfidenceLevel.LOW
         
+        # Normalize request values once instead of per candidate price
+        request_signature = SKUMatcher._normalize_request_attributes(attributes)
+        
+        # Catalogs carry precomputed price signatures; plain lists are signed here
+        if isinstance(normalized_prices, PriceCatalog):
+            price_signatures = normalized_prices.signatures(resource_type)
+        else:
+            price_signatures = [attribute_signature(p.attributes) for p in type_matches]
+        
         # Match by attributes
         exact_matches = []
         partial_matches = []
         
-        for price in type_matches:
-            match_score = SKUMatcher._calculate_match_score(price.attributes, attributes)
+        for price, price_signature in zip(type_matches, price_signatures):
+            match_score = SKUMatcher._calculate_match_score(price_signature, request_signature)
             
             if match_score == 1.0:
                 exact_matches.append(price)
@@ -88,37 +101,40 @@ class SKUMatcher:
         return type_matches, ConfidenceLevel.LOW
     
     @staticmethod
-    def _calculate_match_score(price_attrs: Dict[str, Any], request_attrs: Dict[str, Any]) -> float:
+    def _normalize_request_attributes(request_attrs: Dict[str, Any]) -> FrozenSet[Tuple[str, str]]:
         """
-        Calculate match score between price attributes and request attributes.
+        Normalize request attributes for comparison.
         
         Args:
-            price_attrs: Attributes from pricing SKU
             request_attrs: Attributes from request
             
         Returns:
-            Match score (0.0 to 1.0)
+            Frozenset of (key, lowercased/stripped string value) pairs
         """
-        if not request_attrs:
-            return 0.0
-        
-        matched = 0
-        total = len(request_attrs)
+        return frozenset(
+            (key, str(value).lower().strip())
+            for key, value in request_attrs.items()
+        )
+    
+    @staticmethod
+    def _calculate_match_score(
+        price_signature: FrozenSet[Tuple[str, str]],
+        request_signature: FrozenSet[Tuple[str, str]]
+    ) -> float:
+        """
+        Calculate match score between price attributes and request attributes.
         
-        for key, value in request_attrs.items():
-            price_value = price_attrs.get(key)
-            
-            if price_value is None:
-                continue
-            
-            # Normalize values for comparison
-            price_value_str = str(price_value).lower().strip()
-            request_value_str = str(value).lower().strip()
+        Args:
+            price_signature: Price attributes from attribute_signature
+            request_signature: Request attributes from _normalize_request_attributes
             
-            if price_value_str == request_value_str:
-                matched += 1
+        Returns:
+            Match score (0.0 to 1.0)
+        """
+        if not request_signature:
+            return 0.0
         
-        return matched / total if total > 0 else 0.0
+        return len(price_signature & request_signature) / len(request_signature)
     
     @staticmethod
     def filter_by_usage_type(
@@ -138,7 +154,8 @@ class SKUMatcher:
         if not usage_type:
             return prices
         
-        filtered = [p for p in prices if usage_type.lower() in p.usage_type.lower()]
+        query = usage_type.lower()
+        filtered = [p for p in prices if query in p.usage_type.lower()]
         
         if not filtered:
             logger.warning(f"No prices found for usage_type: {usage_type}")
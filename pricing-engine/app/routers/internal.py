@@ -39,15 +39,12 @@ async def lookup_pricing(
     Raises:
         HTTPException: 400 for invalid input, 404 for no prices found, 503 for service unavailable
     """
-    logger.info(f"Pricing lookup: service={request.service}, region={request.region}, resource_type={request.resource_type}")
-    
     # Validate service
-    supported_services = settings.get_supported_services_list()
-    if request.service not in supported_services:
+    if request.service not in settings.supported_services_set:
         logger.error(f"Unsupported service: {request.service}")
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported service: {request.service}. Supported: {', '.join(supported_services)}"
+            detail=f"Unsupported service: {request.service}. Supported: {', '.join(settings.supported_services_list)}"
         )
     
     # Validate region
@@ -58,6 +55,8 @@ async def lookup_pricing(
             detail=f"Unsupported region: {request.region}"
         )
     
+    logger.info(f"Pricing lookup: service={request.service}, region={request.region}, resource_type={request.resource_type}")
+    
     try:
         # Perform pricing lookup
         response = await service.lookup_pricing(request)
@@ -95,7 +94,8 @@ async def health_check():
 async def get_metadata():
     """Get pricing metadata."""
     return {
-        "supported_services": settings.get_supported_services_list(),
-        "supported_regions": list(RegionMapper.get_all_regions().keys()),
-        "cache_enabled": settings.enable_cache
+        "supported_services": list(settings.supported_services_list),
+        "supported_regions": list(RegionMapper.get_region_codes()),
+        "cache_enabled": settings.enable_cache,
+        "recent_lookup_cache": pricing_service.get_recent_lookup_stats() if pricing_service else None
     }
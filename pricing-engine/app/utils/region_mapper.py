@@ -1,7 +1,8 @@
 """
 Region mapper for AWS pricing regions.
 """
-from typing import Dict, Optional
+import sys
+from typing import Dict, FrozenSet, Optional, Tuple
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -42,6 +43,9 @@ class RegionMapper:
         'af-south-1': 'Africa (Cape Town)',
     }
     
+    _REGION_CODES: Tuple[str, ...] = tuple(REGION_MAP)
+    _REGION_CODE_SET: FrozenSet[str] = frozenset(REGION_MAP)
+    
     @classmethod
     def get_pricing_region(cls, region_code: str) -> Optional[str]:
         """
@@ -57,15 +61,18 @@ class RegionMapper:
         
         if not pricing_region:
             logger.warning(f"Unknown region code: {region_code}")
+            return pricing_region
         
-        return pricing_region
+        # Interned like the offer's location values, so the per-product
+        # region filter compares by identity
+        return sys.intern(pricing_region)
     
     @classmethod
     def is_supported_region(cls, region_code: str) -> bool:
         """Check if region is supported."""
-        return region_code in cls.REGION_MAP
+        return region_code in cls._REGION_CODE_SET
     
     @classmethod
-    def get_all_regions(cls) -> Dict[str, str]:
-        """Get all supported regions."""
-        return cls.REGION_MAP.copy()
+    def get_region_codes(cls) -> Tuple[str, ...]:
+        """Get all supported region codes (computed once)."""
+        return cls._REGION_CODES
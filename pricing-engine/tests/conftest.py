@@ -0,0 +1,7 @@
+"""
+Shared test configuration.
+"""
+import os
+
+# Settings require a Redis URL at import time; tests never connect to it
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
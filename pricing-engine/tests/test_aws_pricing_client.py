@@ -0,0 +1,187 @@
+"""
+Tests for streaming offer parsing.
+"""
+import asyncio
+import json
+import threading
+import pytest
+from app.pricing.aws_pricing_client import AWSPricingClient, _ThreadedByteReader
+
+
+OFFER = {
+    'formatVersion': 'v1.0',
+    'disclaimer': 'This pricing list is for informational purposes only.',
+    'offerCode': 'AmazonEC2',
+    'version': '20240115000000',
+    'publicationDate': '2024-01-15T00:00:00Z',
+    'products': {
+        'SKU1': {
+            'sku': 'SKU1',
+            'productFamily': 'Compute Instance',
+            'attributes': {
+                'location': 'US East (N. Virginia)',
+                'instanceType': 't3.micro',
+                'usagetype': 'BoxUsage:t3.micro'
+            }
+        },
+        'SKU2': {
+            'sku': 'SKU2',
+            'productFamily': 'Storage',
+            'attributes': {
+                'location': 'US East (N. Virginia)',
+                'volumeApiName': 'gp3',
+                'usagetype': 'EBS:VolumeUsage.gp3'
+            }
+        },
+        'SKU3': {
+            'sku': 'SKU3',
+            'productFamily': 'Compute Instance',
+            'attributes': {
+                'location': 'EU (Ireland)',
+                'instanceType': 't3.micro',
+                'usagetype': 'EU-BoxUsage:t3.micro'
+            }
+        }
+    },
+    'terms': {
+        'OnDemand': {
+            'SKU1': {
+                'SKU1.JRTCKXETXF': {
+                    'sku': 'SKU1',
+                    'priceDimensions': {
+                        'SKU1.JRTCKXETXF.6YS6EN2CT7': {
+                            'unit': 'Hrs',
+                            'pricePerUnit': {'USD': '0.0104000000'}
+                        }
+                    }
+                }
+            },
+            'SKU2': {
+                'SKU2.JRTCKXETXF': {
+                    'sku': 'SKU2',
+                    'priceDimensions': {
+                        'SKU2.JRTCKXETXF.6YS6EN2CT7': {
+                            'unit': 'GB-Mo',
+                            'pricePerUnit': {'USD': '0.0800000000'}
+                        }
+                    }
+                }
+            }
+        },
+        'Reserved': {
+            'SKU1': {
+                'SKU1.4NA7Y494T4': {
+                    'sku': 'SKU1',
+                    'priceDimensions': {}
+                }
+            }
+        }
+    }
+}
+
+
+async def _chunked(payload: bytes, size: int):
+    """Yield payload in fixed-size chunks, like a streamed response body."""
+    for start in range(0, len(payload), size):
+        yield payload[start:start + size]
+
+
+async def _parse(size: int):
+    client = AWSPricingClient(base_url="http://pricing.test")
+    try:
+        return await client._parse_offer(_chunked(json.dumps(OFFER).encode(), size))
+    finally:
+        await client.close()
+
+
+class TestParseOffer:
+    """Test incremental offer parsing."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('chunk_size', [1, 7, 64, 1 << 20])
+    async def test_chunk_boundaries(self, chunk_size):
+        """Test parsing is independent of how the body is chunked."""
+        data = await _parse(chunk_size)
+        
+        assert data['products'] == OFFER['products']
+        assert data['terms']['OnDemand'] == OFFER['terms']['OnDemand']
+    
+    @pytest.mark.asyncio
+    async def test_reserved_terms_skipped(self):
+        """Test only on-demand terms are kept."""
+        data = await _parse(64)
+        
+        assert list(data['terms']) == ['OnDemand']
+    
+    @pytest.mark.asyncio
+    async def test_metadata_kept(self):
+        """Test top-level offer metadata is kept."""
+        data = await _parse(64)
+        
+        assert data['version'] == '20240115000000'
+        assert data['publicationDate'] == '2024-01-15T00:00:00Z'
+        assert data['offerCode'] == 'AmazonEC2'
+        assert data['formatVersion'] == 'v1.0'
+    
+    @pytest.mark.asyncio
+    async def test_products_by_location(self):
+        """Test products are grouped by pricing location."""
+        data = await _parse(64)
+        
+        by_location = data['products_by_location']
+        assert set(by_location) == {'US East (N. Virginia)', 'EU (Ireland)'}
+        assert set(by_location['US East (N. Virginia)']) == {'SKU1', 'SKU2'}
+        assert set(by_location['EU (Ireland)']) == {'SKU3'}
+        assert by_location['EU (Ireland)']['SKU3'] is data['products']['SKU3']
+    
+    @pytest.mark.asyncio
+    async def test_prices_parsed_as_strings(self):
+        """Test price strings are kept verbatim for the normalizers."""
+        data = await _parse(64)
+        
+        dimension = data['terms']['OnDemand']['SKU1']['SKU1.JRTCKXETXF']['priceDimensions']['SKU1.JRTCKXETXF.6YS6EN2CT7']
+        assert dimension['pricePerUnit']['USD'] == '0.0104000000'
+    
+    @pytest.mark.asyncio
+    async def test_empty_sections(self):
+        """Test an offer without products or terms parses to empty sections."""
+        client = AWSPricingClient(base_url="http://pricing.test")
+        try:
+            data = await client._parse_offer(_chunked(b'{"version": "1", "products": {}}', 4))
+        finally:
+            await client.close()
+        
+        assert data['products'] == {}
+        assert data['terms'] == {'OnDemand': {}}
+        assert data['products_by_location'] == {}
+
+
+class TestThreadedByteReader:
+    """Test the blocking read() adapter."""
+    
+    @pytest.mark.asyncio
+    async def test_zero_size_probe_does_not_consume(self):
+        """Test read(0) returns b'' without consuming a chunk."""
+        reader = _ThreadedByteReader(_chunked(b'abcdef', 3), asyncio.get_running_loop())
+        
+        def read_all():
+            return [reader.read(0), reader.read(65536), reader.read(65536), reader.read(65536)]
+        
+        assert await asyncio.to_thread(read_all) == [b'', b'abc', b'def', b'']
+    
+    @pytest.mark.asyncio
+    async def test_parse_runs_off_event_loop(self, monkeypatch):
+        """Test entries are built in a worker thread, not on the loop thread."""
+        store_threads = set()
+        store_entry = AWSPricingClient._store_entry
+        
+        def recording_store_entry(targets, section, key, value):
+            store_threads.add(threading.get_ident())
+            store_entry(targets, section, key, value)
+        
+        monkeypatch.setattr(AWSPricingClient, '_store_entry', staticmethod(recording_store_entry))
+        
+        data = await _parse(64)
+        
+        assert set(data['products']) == {'SKU1', 'SKU2', 'SKU3'}
+        assert store_threads and threading.get_ident() not in store_threads
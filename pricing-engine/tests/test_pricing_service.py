@@ -0,0 +1,105 @@
+"""
+Tests for the pricing service lookup caches.
+"""
+import pytest
+from app.cache.memory_cache import MemoryCache
+from app.pricing import pricing_service as pricing_service_module
+from app.pricing.pricing_service import PricingService, RECENT_LOOKUP_TTL
+from app.schemas.pricing import PriceLookupRequest, PriceLookupResponse, ConfidenceLevel
+
+
+class FakePricingClient:
+    """Serves a fixed, empty offer whose version tests can bump."""
+    
+    def __init__(self):
+        self.version = '20240115000000'
+        self.fetch_count = 0
+    
+    async def fetch_service_pricing(self, service):
+        self.fetch_count += 1
+        return {
+            'version': self.version,
+            'publicationDate': '2024-01-15T00:00:00Z',
+            'products': {},
+            'terms': {'OnDemand': {}}
+        }
+    
+    def get_cached_offer_version(self, service):
+        return self.version if self.fetch_count else None
+
+
+REQUEST = PriceLookupRequest(
+    service='ec2',
+    region='us-east-1',
+    resource_type='instance',
+    attributes={'instanceType': 't3.micro'}
+)
+
+
+@pytest.fixture
+def client():
+    return FakePricingClient()
+
+
+@pytest.fixture
+def service(client):
+    return PricingService(client, MemoryCache())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for TTL checks."""
+    now = [1000.0]
+    monkeypatch.setattr(pricing_service_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+class TestRecentLookups:
+    """Test the in-process recent lookup cache."""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_memory(self, service, client):
+        """Test a repeat lookup (empty match included) skips the fetch."""
+        first = await service.lookup_pricing(REQUEST)
+        second = await service.lookup_pricing(REQUEST)
+        
+        assert first.prices == []
+        assert second is first
+        assert client.fetch_count == 1
+        assert service.get_recent_lookup_stats() == {'size': 1, 'hits': 1, 'misses': 1}
+    
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, service, clock):
+        """Test entries past RECENT_LOOKUP_TTL are dropped."""
+        response = await service.lookup_pricing(REQUEST)
+        cache_key = service._generate_cache_key(REQUEST)
+        
+        clock[0] += RECENT_LOOKUP_TTL - 1
+        assert service._get_recent_lookup(cache_key, 'ec2') is response
+        
+        clock[0] += 1
+        assert service._get_recent_lookup(cache_key, 'ec2') is None
+        assert cache_key not in service._recent_lookups
+    
+    @pytest.mark.asyncio
+    async def test_new_offer_version_invalidates(self, service, client):
+        """Test responses from an older offer version are not served."""
+        first = await service.lookup_pricing(REQUEST)
+        
+        client.version = '20240201000000'
+        second = await service.lookup_pricing(REQUEST)
+        
+        assert first.metadata.version == '20240115000000'
+        assert second.metadata.version == '20240201000000'
+        assert client.fetch_count == 2
+        assert service.get_recent_lookup_stats()['hits'] == 0
+    
+    def test_lru_bound(self, service, monkeypatch):
+        """Test the least recently used entry is evicted past the bound."""
+        monkeypatch.setattr(pricing_service_module, 'RECENT_LOOKUP_CACHE_SIZE', 2)
+        response = PriceLookupResponse(prices=[], confidence_level=ConfidenceLevel.LOW)
+        
+        for key in ('a', 'b', 'c'):
+            service._remember_lookup(key, response)
+        
+        assert list(service._recent_lookups) == ['b', 'c']
@@ -0,0 +1,63 @@
+"""
+Tests for SKU matching.
+"""
+from datetime import datetime
+from app.pricing.price_catalog import PriceCatalog
+from app.pricing.sku_matcher import SKUMatcher
+from app.schemas.pricing import NormalizedPrice, PricingUnit, ConfidenceLevel
+
+
+def _price(sku: str, instance_type: str, usage_type: str = 'BoxUsage:t3.micro') -> NormalizedPrice:
+    return NormalizedPrice(
+        service='ec2',
+        resource_type='instance',
+        usage_type=usage_type,
+        region='us-east-1',
+        unit=PricingUnit.HOUR,
+        price_per_unit=0.0104,
+        attributes={'instanceType': instance_type, 'tenancy': 'Shared'},
+        effective_date=datetime(2024, 1, 15),
+        sku=sku
+    )
+
+
+class TestSKUMatcher:
+    """Test SKU matching."""
+    
+    def test_single_exact_match_high_confidence(self):
+        """Test a single exact match with usage_type and unit is HIGH."""
+        prices = [_price('SKU1', 't3.micro'), _price('SKU2', 'm5.large')]
+        
+        matches, confidence = SKUMatcher.match_prices(prices, 'instance', {'instanceType': 't3.micro'})
+        
+        assert [p.sku for p in matches] == ['SKU1']
+        assert confidence == ConfidenceLevel.HIGH
+    
+    def test_tied_exact_matches_medium_confidence(self):
+        """Test several exact matches are MEDIUM."""
+        prices = [_price('SKU1', 't3.micro'), _price('SKU2', 't3.micro')]
+        
+        matches, confidence = SKUMatcher.match_prices(prices, 'instance', {'instanceType': 't3.micro'})
+        
+        assert [p.sku for p in matches] == ['SKU1', 'SKU2']
+        assert confidence == ConfidenceLevel.MEDIUM
+    
+    def test_catalog_and_list_match_alike(self):
+        """Test a PriceCatalog matches the same prices as a plain list."""
+        prices = [_price('SKU1', 't3.micro'), _price('SKU2', 'm5.large')]
+        
+        from_list = SKUMatcher.match_prices(prices, 'instance', {'instanceType': 'T3.Micro '})
+        from_catalog = SKUMatcher.match_prices(PriceCatalog(prices), 'instance', {'instanceType': 'T3.Micro '})
+        
+        assert from_list == from_catalog
+    
+    def test_partial_match_medium_confidence(self):
+        """Test a better-than-half attribute match is MEDIUM."""
+        prices = [_price('SKU1', 't3.micro')]
+        
+        matches, confidence = SKUMatcher.match_prices(
+            prices, 'instance', {'instanceType': 't3.micro', 'tenancy': 'shared', 'operatingSystem': 'Linux'}
+        )
+        
+        assert [p.sku for p in matches] == ['SKU1']
+        assert confidence == ConfidenceLevel.MEDIUM
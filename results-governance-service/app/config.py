@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     
     # Database (MUST be set via environment variables)
     database_url: str = Field(..., env="DATABASE_URL")
+    db_pool_size: int = 20
+    db_pool_overflow: int = 40
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_timeout: int = 5  # seconds to wait for a free connection
     
     # Audit
     enable_audit_log: bool = True
@@ -1,12 +1,16 @@
 """
 Results & Governance Service - Main FastAPI application.
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.config import settings
 from app.routers import internal
-from app.persistence.database import init_db
+from app.middleware.correlation import CorrelationIDMiddleware
+from app.persistence.database import init_db, warm_pool
+from app.persistence.audit_writer import audit_writer
 from app.utils.logger import setup_logging, get_logger
 
 # Setup logging
@@ -20,14 +24,22 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Results & Governance Service...")
     
-    # Initialize database
+    # Initialize database (blocking DDL, kept off the event loop)
     try:
-        init_db()
+        await asyncio.to_thread(init_db)
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    # Pre-open pooled connections; a failure here only costs first-request latency
+    try:
+        await asyncio.to_thread(warm_pool)
+    except Exception as e:
+        logger.warning(f"Failed to warm database pool: {e}")
+    
+    audit_writer.start()
+    
     logger.info(f"Database URL: {settings.database_url}")
     logger.info(f"Audit logging: {'enabled' if settings.enable_audit_log else 'disabled'}")
     logger.info(f"Retention days: {settings.retention_days}")
@@ -37,6 +49,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Results & Governance Service...")
+    
+    # Drain queued audit entries before exit
+    await audit_writer.stop()
+    
     logger.info("Results & Governance Service shut down")
 
 
@@ -46,6 +62,7 @@ app = FastAPI(
     description="AWS Cost Results System of Record",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None
 )
@@ -59,6 +76,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Custom middleware
+app.add_middleware(CorrelationIDMiddleware)
+
 # Include routers
 app.include_router(internal.router)
 
@@ -0,0 +1,36 @@
+"""
+Correlation ID middleware.
+Assigns each request a server-generated ID and carries the caller's
+correlation ID alongside it for tracing.
+"""
+import uuid
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from app.utils.logger import set_correlation_id, set_request_id
+
+# Matches AuditLog.correlation_id (String(255)); longer inbound values are truncated
+MAX_CORRELATION_ID_LENGTH = 255
+
+
+class CorrelationIDMiddleware(BaseHTTPMiddleware):
+    """Middleware to add request and correlation IDs to requests."""
+    
+    async def dispatch(self, request: Request, call_next) -> Response:
+        # Server-generated ID is authoritative for audit records
+        request_id = str(uuid.uuid4())
+        set_request_id(request_id)
+        
+        # Caller's ID (the orchestrator forwards it) is kept for tracing only
+        correlation_id = request.headers.get('X-Correlation-ID', '')[:MAX_CORRELATION_ID_LENGTH]
+        set_correlation_id(correlation_id)
+        
+        # Process request
+        response = await call_next(request)
+        
+        # Add IDs to response headers
+        response.headers['X-Request-ID'] = request_id
+        if correlation_id:
+            response.headers['X-Correlation-ID'] = correlation_id
+        
+        return response
@@ -1,7 +1,7 @@
 """
 Audit Log database model.
 """
-from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy import Column, String, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 import uuid
@@ -17,18 +17,27 @@ class AuditLog(Base):
     audit_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Timestamp
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    # Naive UTC; the Python default covers tables created before server_default existed
+    # (create_all does not alter them), the server default covers inserts from outside the ORM
+    timestamp = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=text("timezone('utc', now())"),
+        index=True
+    )
     
     # Action details
-    action = Column(String(50), nullable=False, index=True)  # persist, compare, policy_eval, gate
+    action = Column(String(50), nullable=False)  # persist, compare, policy_eval, gate
     actor = Column(String(255), nullable=True)  # user or service
-    correlation_id = Column(String(255), nullable=True, index=True)
+    correlation_id = Column(String(255), nullable=True)
     
     # Input/Output
     input_data = Column(JSONB, nullable=True)
     outcome = Column(JSONB, nullable=True)
     
-    # Indexes for queries
+    # Indexes for queries (idx_action_time also serves action-only lookups)
+    # Existing databases: app/persistence/migrations/001_audit_log_indexes.sql
     __table_args__ = (
         Index('idx_action_time', 'action', 'timestamp'),
         Index('idx_correlation', 'correlation_id'),
@@ -3,7 +3,7 @@ Cost result domain models with IMMUTABILITY guarantees.
 
 CRITICAL: Results are WRITE-ONCE and cannot be modified after creation.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
@@ -83,7 +83,7 @@ class CostResult(BaseModel):
         description="Immutability flag (always True)"
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp (immutable)"
     )
     created_by: Optional[str] = Field(
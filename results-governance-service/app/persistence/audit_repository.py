@@ -1,5 +1,7 @@
 """
-Audit repository for immutable audit logging.
+Audit repository for querying the immutable audit log.
+
+Entries are written by app.persistence.audit_writer.
 """
 from typing import List, Optional
 from datetime import datetime
@@ -11,7 +13,7 @@ logger = get_logger(__name__)
 
 
 class AuditRepository:
-    """Repository for immutable audit logging."""
+    """Read-only repository for the immutable audit log."""
     
     def __init__(self, db: Session):
         """
@@ -22,43 +24,6 @@ class AuditRepository:
         """
         self.db = db
     
-    def log_action(
-        self,
-        action: str,
-        actor: Optional[str] = None,
-        correlation_id: Optional[str] = None,
-        input_data: Optional[dict] = None,
-        outcome: Optional[dict] = None
-    ) -> AuditLog:
-        """
-        Log an action (immutable).
-        
-        Args:
-            action: Action type (persist, compare, policy_eval, gate)
-            actor: Actor (user or service)
-            correlation_id: Correlation ID for tracing
-            input_data: Input data
-            outcome: Outcome data
-            
-        Returns:
-            Audit log entry
-        """
-        audit_log = AuditLog(
-            action=action,
-            actor=actor,
-            correlation_id=correlation_id,
-            input_data=input_data,
-            outcome=outcome
-        )
-        
-        self.db.add(audit_log)
-        self.db.commit()
-        self.db.refresh(audit_log)
-        
-        logger.info(f"Logged action: {action} (audit_id={audit_log.audit_id})")
-        
-        return audit_log
-    
     def query_audit(
         self,
         action: Optional[str] = None,
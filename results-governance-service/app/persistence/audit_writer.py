@@ -0,0 +1,155 @@
+"""
+Batched audit log writer.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
+from app.models.audit_log import AuditLog
+from app.persistence.database import SessionLocal
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AuditWriter:
+    """Queues audit entries and inserts them in batches from a background task."""
+    
+    def __init__(self, batch_size: int = 1000, flush_interval: float = 0.05, max_queue_size: int = 10000):
+        """
+        Initialize writer.
+        
+        Args:
+            batch_size: Maximum rows per INSERT
+            flush_interval: Seconds to wait for more entries before flushing a batch
+            max_queue_size: Queue bound; producers wait when it is full
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Entries that could not be written even one at a time
+        self.failed_count = 0
+    
+    def start(self):
+        """Start the background flusher (call from the running event loop)."""
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit writer started")
+    
+    async def stop(self):
+        """Flush everything queued so far and stop the flusher."""
+        if self._task is None:
+            return
+        
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        logger.info("Audit writer stopped")
+    
+    async def log_action(
+        self,
+        action: str,
+        actor: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        input_data: Optional[dict] = None,
+        outcome: Optional[dict] = None
+    ):
+        """
+        Queue an audit entry (immutable once written).
+        
+        Falls back to a direct insert when the flusher is not running.
+        
+        Args:
+            action: Action type (persist, compare, policy_eval, gate)
+            actor: Actor (user or service)
+            correlation_id: Correlation ID for tracing
+            input_data: Input data
+            outcome: Outcome data
+        """
+        entry = {
+            'action': action,
+            'actor': actor,
+            'correlation_id': correlation_id,
+            'input_data': input_data,
+            'outcome': outcome
+        }
+        
+        if self._task is None:
+            await asyncio.to_thread(self._write_batch, [entry])
+            return
+        
+        await self._queue.put(entry)
+    
+    async def _run(self):
+        """Collect entries into batches and write them until stopped."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            entry = await self._queue.get()
+            if entry is None:
+                return
+            
+            batch = [entry]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+            
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                
+                if entry is None:
+                    stopping = True
+                    break
+                
+                batch.append(entry)
+            
+            await self._flush(batch)
+            
+            if stopping:
+                return
+    
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        """
+        Write a batch, retrying once and then row by row so one bad entry
+        cannot take the rest of the batch with it.
+        """
+        for attempt in range(2):
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+                return
+            except Exception as e:
+                logger.warning(f"Audit batch write failed (attempt {attempt + 1}, {len(batch)} entries): {e}")
+        
+        for entry in batch:
+            try:
+                await asyncio.to_thread(self._write_batch, [entry])
+            except Exception as e:
+                self.failed_count += 1
+                logger.error(
+                    f"Failed to write audit entry: {e}",
+                    extra={"action": entry.get('action'), "correlation_id": entry.get('correlation_id')},
+                    exc_info=True
+                )
+    
+    @staticmethod
+    def _write_batch(batch: List[Dict[str, Any]]):
+        """Insert a batch of audit entries in one executemany round-trip."""
+        db = SessionLocal()
+        try:
+            db.execute(insert(AuditLog), batch)
+            db.commit()
+        finally:
+            db.close()
+        
+        logger.info(f"Logged {len(batch)} audit entries")
+
+
+# Global audit writer (started in main.py lifespan)
+audit_writer = AuditWriter()
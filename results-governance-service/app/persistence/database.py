@@ -1,7 +1,7 @@
 """
 Database setup and session management.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.config import settings
@@ -10,9 +10,15 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 # Create SQLAlchemy engine
+# Connections are recycled on age instead of pinged on every checkout;
+# LIFO reuse keeps the hot connections warm and lets idle ones age out
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_pool_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_timeout=settings.db_pool_timeout,
+    pool_use_lifo=True,
     echo=settings.environment == "development"
 )
 
@@ -38,7 +44,12 @@ def get_db() -> Session:
 
 
 def init_db():
-    """Initialize database tables."""
+    """
+    Initialize database tables.
+    
+    create_all only creates missing tables; schema changes to existing
+    tables are shipped as SQL in app/persistence/migrations/.
+    """
     logger.info("Initializing database...")
     
     # Import models to register them
@@ -49,3 +60,21 @@ def init_db():
     Base.metadata.create_all(bind=engine)
     
     logger.info("Database initialized successfully")
+
+
+def warm_pool():
+    """
+    Open and release a full pool of connections so early requests
+    do not pay connection setup.
+    """
+    connections = []
+    try:
+        for _ in range(engine.pool.size()):
+            connection = engine.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
+    
+    logger.info(f"Warmed database pool with {len(connections)} connections")
@@ -0,0 +1,15 @@
+-- Results Governance Service - audit_logs index changes
+-- init_db() uses create_all, which creates missing tables but never alters
+-- existing ones. Run this once against databases created before these changes.
+
+-- Timestamp default for rows inserted outside the ORM
+ALTER TABLE audit_logs ALTER COLUMN timestamp SET DEFAULT timezone('utc', now());
+
+-- action is served by the leading column of idx_action_time
+DROP INDEX IF EXISTS ix_audit_logs_action;
+CREATE INDEX IF NOT EXISTS idx_action_time ON audit_logs (action, timestamp);
+
+-- correlation_id was indexed twice (column index plus idx_correlation)
+DROP INDEX IF EXISTS ix_audit_logs_correlation_id;
+DROP INDEX IF EXISTS idx_correlation;
+CREATE INDEX idx_correlation ON audit_logs (correlation_id);
@@ -3,21 +3,26 @@ Result repository with WRITE-ONCE semantics.
 
 CRITICAL: Results can only be created, never updated or deleted.
 """
-from typing import List, Optional
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy import select, and_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from app.models.cost_result import CostResult, ResultSummary
 from app.models.exceptions import (
     ImmutableResultError,
     ResultAlreadyExistsError,
     ResultNotFoundError
 )
-from app.persistence.database import get_db
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Results never change once written, so cached entries need no TTL or
+# invalidation; the bound only caps memory
+RESULT_CACHE_SIZE = 4096
+
 
 class ResultRepository:
     """
@@ -28,16 +33,42 @@ class ResultRepository:
     - update(): FORBIDDEN, always throws
     - delete(): FORBIDDEN, always throws
     - get/list(): Read-only operations
+    
+    Holds no session: the request's session is passed to each call, so one
+    instance is safely shared across requests. Read results are kept in an
+    in-process LRU (safe because results are immutable).
     """
     
     def __init__(self):
-        self.session = next(get_db())
+        self._result_cache: "OrderedDict[Tuple[str, str], CostResult]" = OrderedDict()
+    
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[CostResult]:
+        """Get a cached result (LRU order is refreshed on hit)."""
+        result = self._result_cache.get(key)
+        if result is not None:
+            self._result_cache.move_to_end(key)
+        return result
+    
+    def _remember_result(self, result: CostResult):
+        """
+        Cache a result under its ID and job ID, evicting the least recently used.
+        
+        Existing entries are never replaced: the first result seen for a key
+        is the immutable one.
+        """
+        for key in (('result_id', result.result_id), ('job_id', result.job_id)):
+            self._result_cache.setdefault(key, result)
+            self._result_cache.move_to_end(key)
+        
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
     
-    async def create(self, result: CostResult) -> CostResult:
+    async def create(self, session: Session, result: CostResult) -> CostResult:
         """
         Create a new cost result (WRITE-ONCE).
         
         Args:
+            session: Database session for this request
             result: Cost result to create
             
         Returns:
@@ -47,7 +78,7 @@ class ResultRepository:
             ResultAlreadyExistsError: If result for job_id already exists
         """
         # Check if result already exists for this job
-        existing = await self.get_by_job_id(result.job_id)
+        existing = await self.get_by_job_id(session, result.job_id)
         if existing:
             logger.error(
                 f"Attempt to create duplicate result for job {result.job_id}",
@@ -75,8 +106,10 @@ class ResultRepository:
             )
             
             # Database insert logic here
-            # await self.session.execute(insert_statement)
-            # await self.session.commit()
+            # session.execute(insert_statement)
+            # session.commit()
+            
+            self._remember_result(result)
             
             return result
             
@@ -127,52 +160,70 @@ class ResultRepository:
             "Results are permanent for audit and compliance."
         )
     
-    async def get_by_id(self, result_id: str) -> Optional[CostResult]:
+    async def get_by_id(self, session: Session, result_id: str) -> Optional[CostResult]:
         """
         Get result by ID (read-only).
         
         Args:
+            session: Database session for this request
             result_id: Result ID
             
         Returns:
             Cost result or None
         """
+        cached = self._get_cached(('result_id', result_id))
+        if cached is not None:
+            return cached
+        
         logger.debug(
             f"Fetching result {result_id}",
             extra={"result_id": result_id}
         )
         
         # Database query logic here
-        # result = await self.session.execute(select_statement)
-        # return result.scalar_one_or_none()
+        # result = session.execute(select_statement).scalar_one_or_none()
+        result = None  # Placeholder
+        
+        # Misses are not cached: the result may be created later
+        if result is not None:
+            self._remember_result(result)
         
-        return None  # Placeholder
+        return result
     
-    async def get_by_job_id(self, job_id: str) -> Optional[CostResult]:
+    async def get_by_job_id(self, session: Session, job_id: str) -> Optional[CostResult]:
         """
         Get result by job ID (read-only).
         
         Args:
+            session: Database session for this request
             job_id: Job ID
             
         Returns:
             Cost result or None
         """
+        cached = self._get_cached(('job_id', job_id))
+        if cached is not None:
+            return cached
+        
         logger.debug(
             f"Fetching result for job {job_id}",
             extra={"job_id": job_id}
         )
         
         # Database query logic here
-        # result = await self.session.execute(
+        # result = session.execute(
         #     select(CostResult).where(CostResult.job_id == job_id)
-        # )
-        # return result.scalar_one_or_none()
+        # ).scalar_one_or_none()
+        result = None  # Placeholder
+        
+        if result is not None:
+            self._remember_result(result)
         
-        return None  # Placeholder
+        return result
     
     async def list_by_project(
         self,
+        session: Session,
         project_id: str,
         limit: int = 10,
         offset: int = 0
@@ -181,6 +232,7 @@ class ResultRepository:
         List results for a project (read-only, for historical comparison).
         
         Args:
+            session: Database session for this request
             project_id: Project ID
             limit: Max results to return
             offset: Offset for pagination
@@ -198,7 +250,7 @@ class ResultRepository:
         )
         
         # Database query logic here
-        # results = await self.session.execute(
+        # results = session.execute(
         #     select(CostResult)
         #     .where(CostResult.project_id == project_id)
         #     .order_by(CostResult.created_at.desc())
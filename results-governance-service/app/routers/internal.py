@@ -14,8 +14,8 @@ from app.schemas.result import (
 from app.models.cost_result import CostResult
 from app.persistence.database import get_db
 from app.persistence.result_repository import ResultRepository
-from app.persistence.audit_repository import AuditRepository
-from app.utils.logger import get_logger
+from app.persistence.audit_writer import audit_writer
+from app.utils.logger import get_logger, get_correlation_id, get_request_id
 
 logger = get_logger(__name__)
 
@@ -61,12 +61,16 @@ async def store_result(
         repo = ResultRepository(db)
         stored_result = repo.store_result(cost_result)
         
-        # Audit log
-        audit_repo = AuditRepository(db)
-        audit_repo.log_action(
+        # Audit log (batched by the background writer)
+        await audit_writer.log_action(
             action="persist",
             actor="system",
-            input_data={"project_id": request.project_id, "environment": request.environment},
+            correlation_id=get_request_id(),
+            input_data={
+                "project_id": request.project_id,
+                "environment": request.environment,
+                "inbound_correlation_id": get_correlation_id() or None
+            },
             outcome={"result_id": str(stored_result.result_id)}
         )
         
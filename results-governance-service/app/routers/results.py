@@ -4,7 +4,8 @@ API router for cost results with immutability enforcement.
 CRITICAL: Only POST (create) and GET (read) are allowed.
 PUT, PATCH, DELETE return 405 Method Not Allowed.
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Depends, status
+from sqlalchemy.orm import Session
 from typing import List
 from app.models.cost_result import CostResult, ResultSummary
 from app.models.exceptions import (
@@ -12,26 +13,26 @@ from app.models.exceptions import (
     ResultAlreadyExistsError,
     ResultNotFoundError
 )
+from app.persistence.database import get_db
 from app.persistence.result_repository import result_repository
-from app.utils.logger import get_logger
-import uuid
+from app.utils.logger import get_logger, get_request_id
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/results", tags=["results"])
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
-async def create_result(result: CostResult):
+async def create_result(result: CostResult, db: Session = Depends(get_db)):
     """
     Create a new cost result (WRITE-ONCE).
     
     CRITICAL: Results can only be created once per job.
     Attempting to create a duplicate will return 409 Conflict.
     """
-    correlation_id = str(uuid.uuid4())
+    correlation_id = get_request_id()
     
     try:
-        created_result = await result_repository.create(result)
+        created_result = await result_repository.create(db, result)
         
         logger.info(
             f"Result created successfully for job {result.job_id}",
@@ -70,13 +71,13 @@ async def create_result(result: CostResult):
 
 
 @router.get("/{job_id}")
-async def get_result(job_id: str):
+async def get_result(job_id: str, db: Session = Depends(get_db)):
     """
     Get cost result by job ID (read-only).
     """
-    correlation_id = str(uuid.uuid4())
+    correlation_id = get_request_id()
     
-    result = await result_repository.get_by_job_id(job_id)
+    result = await result_repository.get_by_job_id(db, job_id)
     
     if not result:
         return {
@@ -98,7 +99,12 @@ async def get_result(job_id: str):
 
 
 @router.get("")
-async def list_results(project_id: str, limit: int = 10, offset: int = 0):
+async def list_results(
+    project_id: str,
+    limit: int = 10,
+    offset: int = 0,
+    db: Session = Depends(get_db)
+):
     """
     List results for historical comparison (read-only).
     
@@ -109,9 +115,10 @@ async def list_results(project_id: str, limit: int = 10, offset: int = 0):
     
     Returns results ordered by created_at DESC.
     """
-    correlation_id = str(uuid.uuid4())
+    correlation_id = get_request_id()
     
     results = await result_repository.list_by_project(
+        db,
         project_id=project_id,
         limit=limit,
         offset=offset
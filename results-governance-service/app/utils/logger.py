@@ -10,6 +10,7 @@ from contextvars import ContextVar
 
 # Context variables for correlation tracking
 correlation_id_var: ContextVar[str] = ContextVar('correlation_id', default='')
+request_id_var: ContextVar[str] = ContextVar('request_id', default='')
 
 
 class JSONFormatter(logging.Formatter):
@@ -28,6 +29,10 @@ class JSONFormatter(logging.Formatter):
         if correlation_id:
             log_data['correlation_id'] = correlation_id
         
+        request_id = request_id_var.get()
+        if request_id:
+            log_data['request_id'] = request_id
+        
         # Add extra fields
         if hasattr(record, 'extra'):
             log_data.update(record.extra)
@@ -70,3 +75,18 @@ def get_logger(name: str) -> logging.Logger:
 def set_correlation_id(correlation_id: str) -> None:
     """Set correlation ID for current context."""
     correlation_id_var.set(correlation_id)
+
+
+def get_correlation_id() -> str:
+    """Get the caller-supplied correlation ID for current context ('' if none)."""
+    return correlation_id_var.get()
+
+
+def set_request_id(request_id: str) -> None:
+    """Set server-generated request ID for current context."""
+    request_id_var.set(request_id)
+
+
+def get_request_id() -> str:
+    """Get server-generated request ID for current context."""
+    return request_id_var.get()
@@ -0,0 +1,7 @@
+"""
+Shared test configuration.
+"""
+import os
+
+# Settings require a database URL at import time; tests never connect to it
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
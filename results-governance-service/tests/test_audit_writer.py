@@ -0,0 +1,76 @@
+"""
+Tests for the batched audit writer.
+"""
+import pytest
+from app.persistence.audit_writer import AuditWriter
+
+
+class RecordingWriter(AuditWriter):
+    """Audit writer that records batches instead of inserting them."""
+    
+    def __init__(self, fail_batches: int = 0, bad_actions=(), **kwargs):
+        super().__init__(**kwargs)
+        self.fail_batches = fail_batches
+        self.bad_actions = set(bad_actions)
+        self.attempts = []
+        self.written = []
+    
+    def _write_batch(self, batch):
+        self.attempts.append([entry['action'] for entry in batch])
+        if self.fail_batches:
+            self.fail_batches -= 1
+            raise RuntimeError("transient failure")
+        if any(entry['action'] in self.bad_actions for entry in batch):
+            raise ValueError("value too long")
+        self.written.extend(entry['action'] for entry in batch)
+
+
+async def _log_all(writer, actions):
+    writer.start()
+    for action in actions:
+        await writer.log_action(action=action)
+    await writer.stop()
+
+
+class TestAuditWriter:
+    """Test audit batching and failure handling."""
+    
+    @pytest.mark.asyncio
+    async def test_entries_written_in_batches(self):
+        """Test queued entries are flushed in batches of at most batch_size."""
+        writer = RecordingWriter(batch_size=2, flush_interval=1.0)
+        
+        await _log_all(writer, ['a', 'b', 'c'])
+        
+        assert writer.written == ['a', 'b', 'c']
+        assert all(len(batch) <= 2 for batch in writer.attempts)
+    
+    @pytest.mark.asyncio
+    async def test_transient_failure_retried(self):
+        """Test a failed batch is retried once as a whole."""
+        writer = RecordingWriter(fail_batches=1, flush_interval=1.0)
+        
+        await _log_all(writer, ['a', 'b'])
+        
+        assert writer.attempts == [['a', 'b'], ['a', 'b']]
+        assert writer.written == ['a', 'b']
+        assert writer.failed_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_bad_entry_does_not_drop_batch(self):
+        """Test one unwritable entry only loses itself."""
+        writer = RecordingWriter(bad_actions={'bad'}, flush_interval=1.0)
+        
+        await _log_all(writer, ['a', 'bad', 'c'])
+        
+        assert writer.written == ['a', 'c']
+        assert writer.failed_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_direct_write_when_not_started(self):
+        """Test log_action writes immediately without a running flusher."""
+        writer = RecordingWriter()
+        
+        await writer.log_action(action='a')
+        
+        assert writer.written == ['a']
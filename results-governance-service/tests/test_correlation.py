@@ -0,0 +1,60 @@
+"""
+Tests for request and correlation ID handling.
+"""
+import uuid
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.correlation import CorrelationIDMiddleware, MAX_CORRELATION_ID_LENGTH
+from app.utils.logger import get_correlation_id, get_request_id
+
+app = FastAPI()
+app.add_middleware(CorrelationIDMiddleware)
+
+
+@app.get("/ids")
+async def ids():
+    return {"request_id": get_request_id(), "correlation_id": get_correlation_id()}
+
+
+client = TestClient(app)
+
+
+class TestCorrelationMiddleware:
+    """Test correlation middleware."""
+    
+    def test_request_id_is_server_generated(self):
+        """Test the request ID ignores caller headers."""
+        response = client.get("/ids", headers={"X-Correlation-ID": "caller-id", "X-Request-ID": "spoofed"})
+        data = response.json()
+        
+        assert data["request_id"] != "spoofed"
+        assert uuid.UUID(data["request_id"])
+        assert response.headers["X-Request-ID"] == data["request_id"]
+    
+    def test_inbound_correlation_id_kept_separately(self):
+        """Test the caller's correlation ID is carried and echoed."""
+        response = client.get("/ids", headers={"X-Correlation-ID": "caller-id"})
+        data = response.json()
+        
+        assert data["correlation_id"] == "caller-id"
+        assert response.headers["X-Correlation-ID"] == "caller-id"
+    
+    def test_missing_correlation_id(self):
+        """Test no correlation ID is invented when the caller sends none."""
+        response = client.get("/ids")
+        
+        assert response.json()["correlation_id"] == ""
+        assert "X-Correlation-ID" not in response.headers
+    
+    def test_oversized_correlation_id_truncated(self):
+        """Test inbound IDs are capped to the audit column length."""
+        response = client.get("/ids", headers={"X-Correlation-ID": "x" * 1000})
+        
+        assert response.json()["correlation_id"] == "x" * MAX_CORRELATION_ID_LENGTH
+    
+    def test_ids_unique_per_request(self):
+        """Test each request gets its own request ID."""
+        first = client.get("/ids").json()["request_id"]
+        second = client.get("/ids").json()["request_id"]
+        
+        assert first != second
@@ -0,0 +1,88 @@
+"""
+Tests for the write-once result repository.
+"""
+import pytest
+from decimal import Decimal
+from app.models.cost_result import CostResult
+from app.models.exceptions import ResultAlreadyExistsError, ImmutableResultError
+from app.persistence import result_repository as result_repository_module
+from app.persistence.result_repository import ResultRepository
+
+
+def _result(result_id: str, job_id: str = 'job-1') -> CostResult:
+    return CostResult(
+        result_id=result_id,
+        job_id=job_id,
+        pricing_snapshot='2024-01-15T12:00:00Z',
+        usage_profile='prod',
+        total_monthly_cost=Decimal('1234.56'),
+        correlation_id='corr-1'
+    )
+
+
+@pytest.fixture
+def repo():
+    return ResultRepository()
+
+
+class TestResultRepository:
+    """Test write-once semantics and the result cache."""
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_job_rejected(self, repo):
+        """Test a second create for the same job raises."""
+        await repo.create(None, _result('r1'))
+        
+        with pytest.raises(ResultAlreadyExistsError):
+            await repo.create(None, _result('r2'))
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_does_not_replace_cached_result(self, repo):
+        """Test a rejected duplicate leaves the original result cached."""
+        await repo.create(None, _result('r1'))
+        
+        with pytest.raises(ResultAlreadyExistsError):
+            await repo.create(None, _result('r2'))
+        
+        assert (await repo.get_by_job_id(None, 'job-1')).result_id == 'r1'
+        assert await repo.get_by_id(None, 'r2') is None
+    
+    @pytest.mark.asyncio
+    async def test_cache_hits_by_id_and_job(self, repo):
+        """Test a created result is served from cache by either key."""
+        created = _result('r1')
+        await repo.create(None, created)
+        
+        assert await repo.get_by_id(None, 'r1') is created
+        assert await repo.get_by_job_id(None, 'job-1') is created
+    
+    @pytest.mark.asyncio
+    async def test_misses_not_cached(self, repo):
+        """Test unknown results are not remembered."""
+        assert await repo.get_by_job_id(None, 'job-unknown') is None
+        assert len(repo._result_cache) == 0
+    
+    def test_remember_never_replaces(self, repo):
+        """Test an existing cache entry is kept over a later result."""
+        first = _result('r1')
+        repo._remember_result(first)
+        repo._remember_result(_result('r2'))
+        
+        assert repo._get_cached(('job_id', 'job-1')) is first
+    
+    def test_cache_bounded(self, repo, monkeypatch):
+        """Test least recently used entries are evicted past the bound."""
+        monkeypatch.setattr(result_repository_module, 'RESULT_CACHE_SIZE', 4)
+        
+        for i in range(3):
+            repo._remember_result(_result(f'r{i}', job_id=f'job-{i}'))
+        
+        assert len(repo._result_cache) == 4
+        assert repo._get_cached(('result_id', 'r0')) is None
+        assert repo._get_cached(('job_id', 'job-2')) is not None
+    
+    @pytest.mark.asyncio
+    async def test_update_forbidden(self, repo):
+        """Test updates always raise."""
+        with pytest.raises(ImmutableResultError):
+            await repo.update(_result('r1'))